@@ -0,0 +1,32 @@
+"""add_participant_dedup_index
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-02-10 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: str | Sequence[str] | None = "c3d4e5f6a7b8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add composite phone + DOB + ZIP index for duplicate detection."""
+    op.create_index(
+        "ix_participants_phone_dob_zip",
+        "participants",
+        ["phone", "date_of_birth", "address_zip"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the duplicate detection index."""
+    op.drop_index("ix_participants_phone_dob_zip", table_name="participants")
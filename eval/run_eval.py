@@ -1,27 +1,39 @@
 """Evaluation runner -- loads YAML scenarios, executes steps, reports results."""
 
 import dataclasses
+import functools
 import importlib
 import inspect
+import types
 import uuid
+from collections.abc import Mapping
 from contextlib import ExitStack
 from datetime import date
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import yaml
 
 SCENARIOS_DIR = Path(__file__).parent / "scenarios"
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def load_scenario(scenario_name: str) -> dict:
+
+@functools.lru_cache(maxsize=64)
+def load_scenario(scenario_name: str) -> Mapping[str, Any]:
     """Load a YAML scenario file.
 
+    Scenarios are static, so each file is parsed once and cached. The
+    result is shared between callers and only its top level is
+    read-only; nested values such as ``steps`` must not be mutated.
+
     Args:
         scenario_name: Name of scenario (without .yaml extension).
 
     Returns:
-        Parsed scenario dict.
+        Parsed scenario mapping.
 
     Raises:
         FileNotFoundError: If scenario file doesn't exist.
@@ -30,7 +42,7 @@ def load_scenario(scenario_name: str) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Scenario {scenario_name} not found")
     with open(path) as f:
-        return yaml.safe_load(f)
+        return types.MappingProxyType(yaml.load(f, Loader=_YAML_LOADER))
 
 
 def build_mock_participant(participant_data: dict) -> MagicMock:
@@ -14,6 +14,7 @@ from agents import Agent, function_tool
 from src.db.events import log_event
 from src.db.models import Participant
 from src.db.postgres import get_participant_by_id
+from src.shared.validators import with_dnc_flag
 
 MAX_IDENTITY_ATTEMPTS = 2
 
@@ -46,11 +47,10 @@ async def verify_identity(
     expected_year = participant.date_of_birth.year
     expected_zip = participant.address_zip
 
-    # Track attempts via contactability JSONB
+    # Track attempts via contactability JSONB; assign a new dict so the change flushes
     identity_data = participant.contactability or {}
     attempts = identity_data.get("identity_attempts", 0) + 1
-    identity_data["identity_attempts"] = attempts
-    participant.contactability = identity_data
+    participant.contactability = {**identity_data, "identity_attempts": attempts}
 
     if dob_year == expected_year and zip_code == expected_zip:
         participant.identity_status = "verified"
@@ -145,9 +145,7 @@ async def mark_wrong_person(
     """
     participant = await get_participant_by_id(session, participant_id)
     participant.identity_status = "wrong_person"
-    flags = participant.dnc_flags or {}
-    flags["all_channels"] = True
-    participant.dnc_flags = flags
+    participant.dnc_flags = with_dnc_flag(participant.dnc_flags, "all_channels")
     await log_event(
         session,
         participant_id=participant_id,
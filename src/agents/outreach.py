@@ -27,7 +27,7 @@ from src.services.elevenlabs_client import (
     build_system_prompt,
 )
 from src.services.twilio_client import TwilioClient
-from src.shared.validators import is_dnc_blocked
+from src.shared.validators import is_dnc_blocked, with_dnc_flag
 
 
 async def check_dnc_before_contact(
@@ -284,9 +284,7 @@ async def handle_stop_keyword(
         Dict confirming DNC was applied.
     """
     participant = await get_participant_by_id(session, participant_id)
-    flags = participant.dnc_flags or {}
-    flags[channel] = True
-    participant.dnc_flags = flags
+    participant.dnc_flags = with_dnc_flag(participant.dnc_flags, channel)
     await log_event(
         session,
         participant_id=participant_id,
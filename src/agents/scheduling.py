@@ -38,12 +38,13 @@ async def check_geo_eligibility(
         Dict with 'eligible' boolean and distance info.
     """
     participant = await get_participant_by_id(session, participant_id)
-    trial = await get_trial(session, trial_id)
     distance = participant.distance_to_site_km
-    max_km = trial.max_distance_km or 80.0
-
+    # Unknown distance needs no trial limit; skip the trial fetch.
     if distance is None:
         return {"eligible": True, "reason": "distance_unknown"}
+
+    trial = await get_trial(session, trial_id)
+    max_km = trial.max_distance_km or 80.0
     if distance <= max_km:
         return {"eligible": True, "distance_km": distance}
     return {"eligible": False, "distance_km": distance, "max_km": max_km}
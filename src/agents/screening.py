@@ -58,10 +58,15 @@ async def check_hard_excludes(
     """
     criteria = await get_trial_criteria(session, trial_id)
     exclusions = criteria.get("exclusion", {})
-    matched = []
-    for key, required_value in exclusions.items():
-        if key in responses and responses[key] == required_value:
-            matched.append(key)
+    # Key-view intersection runs in C; most calls share no keys and stop here.
+    shared = exclusions.keys() & responses.keys()
+    if not shared:
+        return {"excluded": False}
+    matched = [
+        key
+        for key, required_value in exclusions.items()
+        if key in shared and responses[key] == required_value
+    ]
     if matched:
         return {"excluded": True, "matched_criteria": matched}
     return {"excluded": False}
@@ -2,8 +2,10 @@
 
 import uuid
 from datetime import UTC, datetime
+from typing import Any
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import Event
@@ -66,3 +68,60 @@ async def log_event(
     session.add(event)
     await session.flush()
     return event
+
+
+EVENT_ROW_COLUMNS = (
+    "participant_id",
+    "event_type",
+    "idempotency_key",
+    "appointment_id",
+    "conversation_id",
+    "trial_id",
+    "payload",
+    "provenance",
+    "channel",
+)
+
+
+def _build_event_row(event: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a batch entry into a full events-table row.
+
+    Every row in a multi-VALUES insert must carry the same columns, so
+    optional fields default to None and payload defaults to {}.
+
+    Args:
+        event: Keyword arguments as accepted by log_event().
+
+    Returns:
+        Row dict with event_id and created_at populated.
+    """
+    row = {column: event.get(column) for column in EVENT_ROW_COLUMNS}
+    row["payload"] = row["payload"] or {}
+    row["event_id"] = uuid.uuid4()
+    row["created_at"] = datetime.now(UTC)
+    return row
+
+
+async def log_events(session: AsyncSession, batch: list[dict[str, Any]]) -> list[uuid.UUID]:
+    """Log several events in a single INSERT round-trip.
+
+    Rows whose idempotency_key already exists (or repeats within the
+    batch) are skipped via ON CONFLICT DO NOTHING.
+
+    Args:
+        session: Active database session.
+        batch: Event dicts using the same keys as log_event() kwargs.
+
+    Returns:
+        Event IDs of the rows actually inserted.
+    """
+    if not batch:
+        return []
+    stmt = (
+        pg_insert(Event)
+        .values([_build_event_row(event) for event in batch])
+        .on_conflict_do_nothing(index_elements=[Event.idempotency_key])
+        .returning(Event.event_id)
+    )
+    result = await session.execute(stmt)
+    return list(result.scalars().all())
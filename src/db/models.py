@@ -69,6 +69,15 @@ class Participant(Base):
         DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    __table_args__ = (
+        Index(
+            "ix_participants_phone_dob_zip",
+            "phone",
+            "date_of_birth",
+            "address_zip",
+        ),
+    )
+
     # Relationships
     trials: Mapped[list["ParticipantTrial"]] = relationship(back_populates="participant")
     appointments: Mapped[list["Appointment"]] = relationship(back_populates="participant")
@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, date, datetime
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.models import (
@@ -16,6 +16,10 @@ from src.db.models import (
 )
 from src.shared.identity import generate_mary_id
 
+# Built once so repeated lookups reuse SQLAlchemy's compiled-statement
+# cache entry and asyncpg's prepared statement; only the bind varies.
+_BY_MARY_ID_STMT = select(Participant).where(Participant.mary_id == bindparam("mid"))
+
 
 async def create_participant(
     session: AsyncSession,
@@ -75,7 +79,7 @@ async def get_participant_by_mary_id(
     Returns:
         Participant if found, else None.
     """
-    result = await session.execute(select(Participant).where(Participant.mary_id == mary_id))
+    result = await session.execute(_BY_MARY_ID_STMT, {"mid": mary_id})
     return result.scalar_one_or_none()
 
 
@@ -85,6 +89,9 @@ async def get_participant_by_id(
 ) -> Participant | None:
     """Look up a participant by UUID.
 
+    Uses the session's identity map first, so repeat lookups of a
+    participant already loaded in this session issue no query.
+
     Args:
         session: Active database session.
         participant_id: Participant UUID.
@@ -92,10 +99,7 @@ async def get_participant_by_id(
     Returns:
         Participant if found, else None.
     """
-    result = await session.execute(
-        select(Participant).where(Participant.participant_id == participant_id)
-    )
-    return result.scalar_one_or_none()
+    return await session.get(Participant, participant_id)
 
 
 async def enroll_in_trial(
@@ -1,8 +1,11 @@
 """Async database session factory for Cloud SQL Postgres."""
 
 from collections.abc import AsyncGenerator
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -10,11 +13,23 @@ from sqlalchemy.ext.asyncio import (
 
 from src.config.settings import get_settings
 
-_engine = None
+_engine: AsyncEngine | None = None
 _session_factory = None
 
 
-def _get_engine():
+def _json_dumps(value: Any) -> str:
+    """Serialize a JSONB column value with orjson.
+
+    Args:
+        value: JSON-compatible Python value.
+
+    Returns:
+        JSON text for the driver.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _get_engine() -> AsyncEngine:
     """Create or return the cached async engine.
 
     Returns:
@@ -28,6 +43,8 @@ def _get_engine():
             echo=False,
             pool_size=5,
             max_overflow=10,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
         )
     return _engine
 
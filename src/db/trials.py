@@ -75,6 +75,9 @@ async def get_trial(
 ) -> Trial | None:
     """Look up a trial by string ID.
 
+    Uses the session's identity map first, so criteria and scheduling
+    checks against the same trial in one session share a single SELECT.
+
     Args:
         session: Active database session.
         trial_id: Trial string identifier.
@@ -82,8 +85,7 @@ async def get_trial(
     Returns:
         Trial if found, else None.
     """
-    result = await session.execute(select(Trial).where(Trial.trial_id == trial_id))
-    return result.scalar_one_or_none()
+    return await session.get(Trial, trial_id)
 
 
 async def get_trial_criteria(
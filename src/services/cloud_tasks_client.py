@@ -12,7 +12,7 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskEnqueueResult:
     """Result of enqueuing a Cloud Tasks job.
 
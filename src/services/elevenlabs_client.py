@@ -11,7 +11,7 @@ CONVAI_API_URL = "https://api.elevenlabs.io/v1/convai/twilio/outbound-call"
 CONVAI_CONVERSATION_URL = "https://api.elevenlabs.io/v1/convai/conversations"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CallResult:
     """Result of an outbound call initiation.
 
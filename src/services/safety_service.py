@@ -48,6 +48,7 @@ def build_safety_callback(
         Args:
             result: Safety gate evaluation result.
         """
+        # Sequential on purpose: one AsyncSession cannot run queries concurrently.
         coordinator_phone = await _safe_get_coordinator(
             session, trial_id,
         )
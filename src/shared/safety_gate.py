@@ -30,6 +30,51 @@ SAFETY_TRIGGERS = [
 
 HARD_CEILING_MS = 1000
 
+_MEDICAL_ADVICE_PHRASES = (
+    "you should take",
+    "i recommend",
+    "my medical advice",
+    "increase your dose",
+    "stop taking",
+    "prescribe",
+)
+
+_SEVERE_SYMPTOMS_PHRASES = (
+    "chest pain",
+    "difficulty breathing",
+    "shortness of breath",
+    "severe bleeding",
+    "loss of consciousness",
+    "seizure",
+    "suicidal",
+    "self-harm",
+)
+
+_CONSENT_WITHDRAWAL_PHRASES = (
+    "i want to withdraw",
+    "i don't consent",
+    "stop the study",
+    "i want out",
+    "withdraw my consent",
+)
+
+_ANGER_THREATS_PHRASES = (
+    "i'll sue",
+    "lawyer",
+    "report you",
+    "threatening",
+    "going to hurt",
+)
+
+_ADVERSE_EVENT_PHRASES = (
+    "adverse reaction",
+    "adverse event",
+    "side effect",
+    "allergic reaction",
+    "got worse",
+    "bad reaction",
+)
+
 
 @dataclass
 class SafetyResult:
@@ -48,6 +93,16 @@ class SafetyResult:
     elapsed_ms: float = 0.0
 
 
+def warmup() -> None:
+    """Run the trigger checks once outside any timed evaluation.
+
+    Forces the module import and the first pass through every check to
+    happen before the first real ``evaluate_safety`` call, so its
+    ``elapsed_ms`` measures steady state.
+    """
+    _check_triggers("warmup", {})
+
+
 async def evaluate_safety(
     response: str,
     context: dict | None = None,
@@ -71,9 +126,9 @@ async def evaluate_safety(
     Returns:
         SafetyResult with trigger status and timing.
     """
-    start = time.perf_counter()
+    start_ns = time.monotonic_ns()
     result = _check_triggers(response, context or {})
-    elapsed_ms = (time.perf_counter() - start) * 1000
+    elapsed_ms = (time.monotonic_ns() - start_ns) * 1e-6
     result.elapsed_ms = elapsed_ms
 
     if result.triggered and on_trigger:
@@ -102,7 +157,7 @@ def _check_triggers(response: str, context: dict) -> SafetyResult:
     Returns:
         SafetyResult indicating if a trigger was detected.
     """
-    text_lower = response.lower()
+    text_lower = response.casefold()
 
     if _matches_medical_advice(text_lower):
         return SafetyResult(
@@ -160,100 +215,60 @@ def _matches_medical_advice(text: str) -> bool:
     """Detect medical advice patterns.
 
     Args:
-        text: Lowercased response text.
+        text: Casefolded response text.
 
     Returns:
         True if medical advice pattern detected.
     """
-    patterns = [
-        "you should take",
-        "i recommend",
-        "my medical advice",
-        "increase your dose",
-        "stop taking",
-        "prescribe",
-    ]
-    return any(p in text for p in patterns)
+    return any(phrase in text for phrase in _MEDICAL_ADVICE_PHRASES)
 
 
 def _matches_severe_symptoms(text: str) -> bool:
     """Detect severe symptom mentions.
 
     Args:
-        text: Lowercased response text.
+        text: Casefolded response text.
 
     Returns:
         True if severe symptom pattern detected.
     """
-    patterns = [
-        "chest pain",
-        "difficulty breathing",
-        "shortness of breath",
-        "severe bleeding",
-        "loss of consciousness",
-        "seizure",
-        "suicidal",
-        "self-harm",
-    ]
-    return any(p in text for p in patterns)
+    return any(phrase in text for phrase in _SEVERE_SYMPTOMS_PHRASES)
 
 
 def _matches_consent_withdrawal(text: str) -> bool:
     """Detect consent withdrawal language.
 
     Args:
-        text: Lowercased response text.
+        text: Casefolded response text.
 
     Returns:
         True if consent withdrawal detected.
     """
-    patterns = [
-        "i want to withdraw",
-        "i don't consent",
-        "stop the study",
-        "i want out",
-        "withdraw my consent",
-    ]
-    return any(p in text for p in patterns)
+    return any(phrase in text for phrase in _CONSENT_WITHDRAWAL_PHRASES)
 
 
 def _matches_anger_threats(text: str) -> bool:
     """Detect anger or threat language.
 
     Args:
-        text: Lowercased response text.
+        text: Casefolded response text.
 
     Returns:
         True if anger/threats detected.
     """
-    patterns = [
-        "i'll sue",
-        "lawyer",
-        "report you",
-        "threatening",
-        "going to hurt",
-    ]
-    return any(p in text for p in patterns)
+    return any(phrase in text for phrase in _ANGER_THREATS_PHRASES)
 
 
 def _matches_adverse_event(text: str) -> bool:
     """Detect adverse event reports.
 
     Args:
-        text: Lowercased response text.
+        text: Casefolded response text.
 
     Returns:
         True if adverse event pattern detected.
     """
-    patterns = [
-        "adverse reaction",
-        "adverse event",
-        "side effect",
-        "allergic reaction",
-        "got worse",
-        "bad reaction",
-    ]
-    return any(p in text for p in patterns)
+    return any(phrase in text for phrase in _ADVERSE_EVENT_PHRASES)
 
 
 def _matches_repeated_misunderstanding(context: dict) -> bool:
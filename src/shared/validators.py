@@ -53,7 +53,7 @@ def validate_dob_year(year: int) -> bool:
 
 
 def is_dnc_blocked(
-    dnc_flags: dict | None,
+    dnc_flags: dict[str, bool] | None,
     channel: str,
 ) -> bool:
     """Check if a participant is on the Do Not Contact list.
@@ -72,6 +72,23 @@ def is_dnc_blocked(
     return bool(dnc_flags.get(channel))
 
 
+def with_dnc_flag(dnc_flags: dict[str, bool] | None, key: str) -> dict[str, bool]:
+    """Return a copy of the DNC flags with one flag set.
+
+    Callers assign the result back to ``participant.dnc_flags``. The
+    column is plain JSONB, so an in-place edit compares equal to the
+    loaded value and is never flushed; a new dict always is.
+
+    Args:
+        dnc_flags: Current JSONB DNC flags, if any.
+        key: Channel name or ``"all_channels"`` to block.
+
+    Returns:
+        New flags dict with ``key`` set to True.
+    """
+    return {**(dnc_flags or {}), key: True}
+
+
 def validate_channel(channel: str) -> bool:
     """Validate a communication channel.
 
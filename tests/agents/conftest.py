@@ -0,0 +1,107 @@
+"""Shared fixtures for agent tool tests."""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.db.models import Participant
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tests.conftest import FakeSession
+
+_appointment_ids = itertools.count(100)
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """Provide a fresh AsyncMock session for each test.
+
+    Returns:
+        AsyncMock standing in for an AsyncSession.
+    """
+    return AsyncMock()
+
+
+@pytest.fixture
+def session_returning(fake_session: FakeSession) -> Callable[[object], AsyncSession]:
+    """Provide a factory for sessions whose lookup returns an entity.
+
+    Args:
+        fake_session: Lightweight session stub for this test.
+
+    Returns:
+        Callable that queues the given entity as the next
+        ``scalar_one_or_none()`` result and returns the session,
+        typed as an AsyncSession.
+    """
+
+    def _session_returning(entity: object) -> AsyncSession:
+        fake_session.push_result(entity)
+        return fake_session.as_session
+
+    return _session_returning
+
+
+@pytest.fixture
+def make_held() -> Callable[..., MagicMock]:
+    """Provide a factory for appointment stand-ins.
+
+    Returns:
+        Callable building a MagicMock appointment with a unique
+        sequential ID, the given status, and any extra attributes.
+    """
+
+    def _make_held(status: str = "held", **attrs: object) -> MagicMock:
+        appointment = MagicMock()
+        appointment.appointment_id = uuid.UUID(int=next(_appointment_ids))
+        appointment.status = status
+        for name, value in attrs.items():
+            setattr(appointment, name, value)
+        return appointment
+
+    return _make_held
+
+
+@pytest.fixture
+def make_participant() -> Callable[..., MagicMock]:
+    """Provide a factory for participant stand-ins.
+
+    Returns:
+        Callable building a MagicMock restricted to Participant's
+        attributes, with the given fields set in one constructor call.
+    """
+
+    def _make_participant(**attrs: object) -> MagicMock:
+        return MagicMock(spec_set=Participant, **attrs)
+
+    return _make_participant
+
+
+@pytest.fixture(scope="module")
+def now() -> datetime:
+    """Freeze the current UTC time once per test module.
+
+    Returns:
+        Timezone-aware datetime shared by the module's tests.
+    """
+    return datetime.now(UTC)
+
+
+@pytest.fixture
+def slot_time(now: datetime) -> datetime:
+    """Provide a bookable slot one week after the frozen ``now``.
+
+    Returns:
+        Timezone-aware slot datetime.
+    """
+    return now + timedelta(days=7)
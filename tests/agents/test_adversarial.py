@@ -4,9 +4,13 @@ Tests deception detection, recheck scheduling, and adversarial rescreen
 with mocked database sessions and external service clients.
 """
 
+from __future__ import annotations
+
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from src.agents.adversarial import (
     adversarial_agent,
@@ -15,30 +19,39 @@ from src.agents.adversarial import (
     schedule_recheck,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tests.conftest import FakeSession
+
+PARTICIPANT_ID = uuid.UUID(int=1)
+
 
 class TestDetectDeception:
     """Deception detection compares screening responses vs EHR data."""
 
-    async def test_detects_deception_with_mismatched_data(self) -> None:
+    async def test_detects_deception_with_mismatched_data(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Deception detected when screening says 'no' but EHR says 'yes'."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "pregnant_or_nursing": {
-                "answer": "no",
-                "provenance": "patient_stated",
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "pregnant_or_nursing": {
+                    "answer": "no",
+                    "provenance": "patient_stated",
+                },
+            },
+            ehr_discrepancies={
+                "pregnant_or_nursing": "yes",
             },
-        }
-        participant_trial.ehr_discrepancies = {
-            "pregnant_or_nursing": "yes",
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await detect_deception(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["deception_detected"] is True
@@ -47,47 +60,47 @@ class TestDetectDeception:
         assert result["discrepancies"][0]["stated"] == "no"
         assert result["discrepancies"][0]["ehr"] == "yes"
 
-    async def test_no_deception_with_matching_data(self) -> None:
+    async def test_no_deception_with_matching_data(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """No deception when EHR discrepancies dict is empty."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": {
-                "answer": "type_2",
-                "provenance": "patient_stated",
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": {
+                    "answer": "type_2",
+                    "provenance": "patient_stated",
+                },
             },
-        }
-        participant_trial.ehr_discrepancies = {}
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+            ehr_discrepancies={},
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await detect_deception(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["deception_detected"] is False
         assert result["discrepancies"] == []
 
-    async def test_handles_missing_ehr_gracefully(self) -> None:
+    async def test_handles_missing_ehr_gracefully(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """No crash and no deception when ehr_discrepancies is None."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": {
-                "answer": "type_2",
-                "provenance": "patient_stated",
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": {
+                    "answer": "type_2",
+                    "provenance": "patient_stated",
+                },
             },
-        }
-        participant_trial.ehr_discrepancies = None
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+            ehr_discrepancies=None,
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await detect_deception(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["deception_detected"] is False
@@ -97,20 +110,18 @@ class TestDetectDeception:
 class TestScheduleRecheck:
     """Recheck scheduling enqueues a Cloud Tasks reminder."""
 
-    async def test_schedule_recheck_enqueues_task(self) -> None:
+    async def test_schedule_recheck_enqueues_task(self, fake_session: FakeSession) -> None:
         """Calls enqueue_reminder and returns the task_id."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
+        participant_id = PARTICIPANT_ID
         trial_id = "trial-42"
-        mock_result = MagicMock()
-        mock_result.task_id = "task-abc-123"
+        mock_result = SimpleNamespace(task_id="task-abc-123")
 
         with patch(
             "src.agents.adversarial.enqueue_reminder",
             return_value=mock_result,
         ) as mock_enqueue:
             result = await schedule_recheck(
-                mock_session,
+                fake_session.as_session,
                 participant_id,
                 trial_id,
             )
@@ -128,18 +139,18 @@ class TestScheduleRecheck:
 class TestRunAdversarialRescreen:
     """Adversarial rescreen updates the ParticipantTrial record."""
 
-    async def test_rescreen_records_results(self) -> None:
+    async def test_rescreen_records_results(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Sets adversarial_recheck_done=True and provenance='system'."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
+        participant_id = PARTICIPANT_ID
         trial_id = "trial-42"
-        participant_trial = MagicMock()
-        participant_trial.adversarial_recheck_done = False
-        participant_trial.adversarial_results = None
+        participant_trial = SimpleNamespace(
+            adversarial_recheck_done=False,
+            adversarial_results=None,
+        )
 
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        mock_session = session_returning(participant_trial)
 
         with patch(
             "src.agents.adversarial.datetime",
@@ -11,6 +11,9 @@ from src.agents.comms import (
     send_communication,
 )
 
+PARTICIPANT_ID = uuid.UUID(int=1)
+APPOINTMENT_ID = uuid.UUID(int=2)
+
 
 class TestCommsAgentDefinition:
     """Comms agent is properly configured."""
@@ -33,7 +36,7 @@ class TestSendCommunication:
         with patch("src.agents.comms.log_event", return_value=MagicMock()):
             result = await send_communication(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "appointment_booked",
                 "sms",
                 {
@@ -59,8 +62,8 @@ class TestScheduleReminder:
         with patch("src.agents.comms.log_event", return_value=MagicMock()):
             result = await schedule_reminder(
                 mock_session,
-                uuid.uuid4(),
-                uuid.uuid4(),
+                PARTICIPANT_ID,
+                APPOINTMENT_ID,
                 "prep_instructions",
                 "sms",
                 send_at,
@@ -80,7 +83,7 @@ class TestHandleUnreachable:
         with patch("src.agents.comms.log_event", return_value=MagicMock()):
             result = await handle_unreachable(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "voice",
             )
         assert result["escalated"] is True
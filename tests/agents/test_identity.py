@@ -3,8 +3,11 @@
 Tests the internal verification functions with mocked sessions.
 """
 
+from __future__ import annotations
+
 import uuid
 from datetime import date
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.agents.identity import (
@@ -15,6 +18,12 @@ from src.agents.identity import (
     verify_identity,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PARTICIPANT_ID = uuid.UUID(int=1)
+DUPLICATE_ID = uuid.UUID(int=2)
+
 
 class TestIdentityAgentDefinition:
     """Identity agent is properly configured."""
@@ -31,68 +40,80 @@ class TestIdentityAgentDefinition:
 class TestVerifyIdentity:
     """Identity verification via DOB year + ZIP."""
 
-    async def test_verified_with_matching_data(self) -> None:
+    async def test_verified_with_matching_data(
+        self, make_participant: Callable[..., MagicMock]
+    ) -> None:
         """Returns verified when DOB year and ZIP match."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.identity_status = "unverified"
-        participant.contactability = {}
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            identity_status="unverified",
+            contactability={},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await verify_identity(mock_session, uuid.uuid4(), 1985, "97201")
+            result = await verify_identity(mock_session, PARTICIPANT_ID, 1985, "97201")
         assert result["verified"] is True
         assert participant.identity_status == "verified"
         assert result["attempts"] == 1
 
-    async def test_rejected_with_wrong_dob(self) -> None:
+    async def test_rejected_with_wrong_dob(
+        self, make_participant: Callable[..., MagicMock]
+    ) -> None:
         """Returns unverified when DOB year does not match."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.identity_status = "unverified"
-        participant.contactability = {}
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            identity_status="unverified",
+            contactability={},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await verify_identity(mock_session, uuid.uuid4(), 1990, "97201")
+            result = await verify_identity(mock_session, PARTICIPANT_ID, 1990, "97201")
         assert result["verified"] is False
 
-    async def test_rejected_with_wrong_zip(self) -> None:
+    async def test_rejected_with_wrong_zip(
+        self, make_participant: Callable[..., MagicMock]
+    ) -> None:
         """Returns unverified when ZIP does not match."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.identity_status = "unverified"
-        participant.contactability = {}
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            identity_status="unverified",
+            contactability={},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await verify_identity(mock_session, uuid.uuid4(), 1985, "97202")
+            result = await verify_identity(mock_session, PARTICIPANT_ID, 1985, "97202")
         assert result["verified"] is False
 
-    async def test_handoff_after_max_attempts(self) -> None:
+    async def test_handoff_after_max_attempts(
+        self, make_participant: Callable[..., MagicMock]
+    ) -> None:
         """Returns handoff_required after 2 failed attempts."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.identity_status = "unverified"
-        participant.contactability = {"identity_attempts": 1}
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            identity_status="unverified",
+            contactability={"identity_attempts": 1},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
             result = await verify_identity(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 1990,
                 "97201",
             )
@@ -109,27 +130,28 @@ class TestVerifyIdentity:
         ):
             result = await verify_identity(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 1985,
                 "97201",
             )
         assert result["error"] == "participant_not_found"
 
-    async def test_tracks_attempt_count(self) -> None:
+    async def test_tracks_attempt_count(self, make_participant: Callable[..., MagicMock]) -> None:
         """Attempt count increments on each call."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.identity_status = "unverified"
-        participant.contactability = {}
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            identity_status="unverified",
+            contactability={},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
             result = await verify_identity(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 1990,
                 "97201",
             )
@@ -141,15 +163,16 @@ class TestVerifyIdentity:
 class TestDetectDuplicate:
     """Duplicate participant detection."""
 
-    async def test_detects_duplicate(self) -> None:
+    async def test_detects_duplicate(self, make_participant: Callable[..., MagicMock]) -> None:
         """Finds another participant with same DOB + ZIP + phone."""
         mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-        dup_id = uuid.uuid4()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.phone = "+15035551234"
+        participant_id = PARTICIPANT_ID
+        dup_id = DUPLICATE_ID
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            phone="+15035551234",
+        )
 
         result_mock = MagicMock()
         result_mock.all.return_value = [(dup_id,)]
@@ -166,13 +189,14 @@ class TestDetectDuplicate:
         assert result["is_duplicate"] is True
         assert str(dup_id) in result["duplicate_ids"]
 
-    async def test_no_duplicate(self) -> None:
+    async def test_no_duplicate(self, make_participant: Callable[..., MagicMock]) -> None:
         """Returns not duplicate when no matches found."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.date_of_birth = date(1985, 6, 15)
-        participant.address_zip = "97201"
-        participant.phone = "+15035551234"
+        participant = make_participant(
+            date_of_birth=date(1985, 6, 15),
+            address_zip="97201",
+            phone="+15035551234",
+        )
 
         result_mock = MagicMock()
         result_mock.all.return_value = []
@@ -182,7 +206,7 @@ class TestDetectDuplicate:
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await detect_duplicate(mock_session, uuid.uuid4())
+            result = await detect_duplicate(mock_session, PARTICIPANT_ID)
         assert result["is_duplicate"] is False
         assert result["duplicate_ids"] == []
 
@@ -190,17 +214,20 @@ class TestDetectDuplicate:
 class TestMarkWrongPerson:
     """Wrong person detection and suppression."""
 
-    async def test_sets_wrong_person_and_dnc(self) -> None:
+    async def test_sets_wrong_person_and_dnc(
+        self, make_participant: Callable[..., MagicMock]
+    ) -> None:
         """Wrong person sets identity_status + DNC all_channels."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.identity_status = "unverified"
-        participant.dnc_flags = {}
+        participant = make_participant(
+            identity_status="unverified",
+            dnc_flags={},
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await mark_wrong_person(mock_session, uuid.uuid4())
+            result = await mark_wrong_person(mock_session, PARTICIPANT_ID)
         assert participant.identity_status == "wrong_person"
         assert participant.dnc_flags["all_channels"] is True
         assert result["marked"] is True
@@ -209,15 +236,16 @@ class TestMarkWrongPerson:
 class TestUpdateIdentityStatus:
     """Identity status updates."""
 
-    async def test_updates_status(self) -> None:
+    async def test_updates_status(self, make_participant: Callable[..., MagicMock]) -> None:
         """Updates the identity_status field."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.identity_status = "unverified"
+        participant = make_participant(
+            identity_status="unverified",
+        )
         with patch(
             "src.agents.identity.get_participant_by_id",
             return_value=participant,
         ):
-            result = await update_identity_status(mock_session, uuid.uuid4(), "verified")
+            result = await update_identity_status(mock_session, PARTICIPANT_ID, "verified")
         assert participant.identity_status == "verified"
         assert result["updated"] is True
@@ -5,8 +5,13 @@ the agent has proper tool registration. The internal functions are the
 business logic; the @function_tool wrappers are the SDK integration layer.
 """
 
+from __future__ import annotations
+
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from src.agents.outreach import (
     assemble_call_context,
@@ -18,6 +23,32 @@ from src.agents.outreach import (
     outreach_agent,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+GET_PARTICIPANT = "src.agents.outreach.get_participant_by_id"
+PARTICIPANT_ID = uuid.UUID(int=1)
+
+
+@pytest.fixture
+def participant(make_participant: Callable[..., MagicMock], mocker: MockerFixture) -> MagicMock:
+    """Build a participant and serve it from get_participant_by_id.
+
+    Returns:
+        Participant mock with default field values.
+    """
+    participant = make_participant(
+        first_name="Jane",
+        last_name="Doe",
+        phone="+15035559999",
+        dnc_flags={},
+        consent={},
+    )
+    mocker.patch(GET_PARTICIPANT, new_callable=AsyncMock, return_value=participant)
+    return participant
+
 
 class TestOutreachAgentDefinition:
     """Outreach agent is properly configured."""
@@ -34,65 +65,41 @@ class TestOutreachAgentDefinition:
 class TestCheckDncBeforeContact:
     """DNC pre-check before any outreach."""
 
-    async def test_blocked_by_internal_dnc(self) -> None:
+    async def test_blocked_by_internal_dnc(
+        self, mock_session: AsyncMock, participant: MagicMock
+    ) -> None:
         """Returns blocked=True when internal DNC flags block channel."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
         participant.dnc_flags = {"voice": True}
-        with patch(
-            "src.agents.outreach.get_participant_by_id",
-            return_value=participant,
-        ):
-            result = await check_dnc_before_contact(mock_session, uuid.uuid4(), "voice")
+        result = await check_dnc_before_contact(mock_session, PARTICIPANT_ID, "voice")
         assert result["blocked"] is True
 
-    async def test_not_blocked_when_clear(self) -> None:
+    async def test_not_blocked_when_clear(
+        self, mock_session: AsyncMock, participant: MagicMock
+    ) -> None:
         """Returns blocked=False when no DNC flags."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.dnc_flags = {}
-        with patch(
-            "src.agents.outreach.get_participant_by_id",
-            return_value=participant,
-        ):
-            result = await check_dnc_before_contact(mock_session, uuid.uuid4(), "voice")
+        result = await check_dnc_before_contact(mock_session, PARTICIPANT_ID, "voice")
         assert result["blocked"] is False
 
-    async def test_returns_blocked_when_participant_missing(self) -> None:
+    async def test_returns_blocked_when_participant_missing(
+        self, mock_session: AsyncMock, mocker: MockerFixture
+    ) -> None:
         """Returns blocked=True when participant not found."""
-        mock_session = AsyncMock()
-        with patch(
-            "src.agents.outreach.get_participant_by_id",
-            return_value=None,
-        ):
-            result = await check_dnc_before_contact(mock_session, uuid.uuid4(), "voice")
+        mocker.patch(GET_PARTICIPANT, new_callable=AsyncMock, return_value=None)
+        result = await check_dnc_before_contact(mock_session, PARTICIPANT_ID, "voice")
         assert result["blocked"] is True
 
-    async def test_blocked_by_twilio_opt_out(self) -> None:
+    async def test_blocked_by_twilio_opt_out(
+        self, mock_session: AsyncMock, participant: MagicMock, mocker: MockerFixture
+    ) -> None:
         """Returns blocked=True when Twilio opt-out is active."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.dnc_flags = {}
-        participant.phone = "+15035559999"
-
-        with (
-            patch(
-                "src.agents.outreach.get_participant_by_id",
-                return_value=participant,
-            ),
-            patch(
-                "src.agents.outreach.TwilioClient",
-            ) as mock_twilio_cls,
-        ):
-            mock_twilio = MagicMock()
-            mock_twilio.check_dnc_status.return_value = True
-            mock_twilio_cls.return_value = mock_twilio
-
-            result = await check_dnc_before_contact(
-                mock_session,
-                uuid.uuid4(),
-                "sms",
-            )
+        mock_twilio_cls = mocker.patch("src.agents.outreach.TwilioClient")
+        mock_twilio_cls.return_value.check_dnc_status.return_value = True
+
+        result = await check_dnc_before_contact(
+            mock_session,
+            PARTICIPANT_ID,
+            "sms",
+        )
         assert result["blocked"] is True
         assert result["reason"] == "twilio_opted_out"
 
@@ -100,13 +107,10 @@ class TestCheckDncBeforeContact:
 class TestAssembleCallContext:
     """Pre-call context assembly."""
 
-    async def test_returns_context_dict(self) -> None:
+    async def test_returns_context_dict(
+        self, mock_session: AsyncMock, participant: MagicMock, mocker: MockerFixture
+    ) -> None:
         """Returns participant + trial context for ElevenLabs."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.first_name = "Jane"
-        participant.last_name = "Doe"
-        participant.phone = "+15035559999"
         trial = MagicMock()
         trial.trial_name = "Diabetes Study A"
         trial.site_name = "OHSU"
@@ -115,11 +119,8 @@ class TestAssembleCallContext:
         trial.exclusion_criteria = {"pregnant": True}
         trial.visit_templates = {"screening": {"duration_min": 90}}
 
-        with (
-            patch("src.agents.outreach.get_participant_by_id", return_value=participant),
-            patch("src.agents.outreach.get_trial", return_value=trial),
-        ):
-            context = await assemble_call_context(mock_session, uuid.uuid4(), "trial-1")
+        mocker.patch("src.agents.outreach.get_trial", return_value=trial)
+        context = await assemble_call_context(mock_session, PARTICIPANT_ID, "trial-1")
         assert context["participant_name"] == "Jane Doe"
         assert context["trial_name"] == "Diabetes Study A"
         assert context["participant_phone"] == "+15035559999"
@@ -130,13 +131,10 @@ class TestAssembleCallContext:
 class TestInitiateOutboundCall:
     """Outbound call initiation via ElevenLabs."""
 
-    async def test_calls_elevenlabs(self) -> None:
+    async def test_calls_elevenlabs(
+        self, mock_session: AsyncMock, participant: MagicMock, mocker: MockerFixture
+    ) -> None:
         """initiate_outbound_call calls ElevenLabs client."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.first_name = "Jane"
-        participant.last_name = "Doe"
-        participant.phone = "+15035559999"
         trial = MagicMock()
         trial.trial_name = "Diabetes Study A"
         trial.site_name = "OHSU"
@@ -149,27 +147,17 @@ class TestInitiateOutboundCall:
         mock_call_result.conversation_id = "conv-123"
         mock_call_result.status = "initiated"
 
-        with (
-            patch(
-                "src.agents.outreach.get_participant_by_id",
-                return_value=participant,
-            ),
-            patch(
-                "src.agents.outreach.get_trial",
-                return_value=trial,
-            ),
-            patch("src.agents.outreach.ElevenLabsClient") as mock_el_cls,
-            patch("src.agents.outreach.log_event"),
-        ):
-            mock_el = AsyncMock()
-            mock_el.initiate_outbound_call.return_value = mock_call_result
-            mock_el_cls.return_value = mock_el
-
-            result = await initiate_outbound_call(
-                mock_session,
-                uuid.uuid4(),
-                "trial-1",
-            )
+        mocker.patch("src.agents.outreach.get_trial", return_value=trial)
+        mocker.patch("src.agents.outreach.log_event")
+        mock_el = AsyncMock()
+        mock_el.initiate_outbound_call.return_value = mock_call_result
+        mocker.patch("src.agents.outreach.ElevenLabsClient", return_value=mock_el)
+
+        result = await initiate_outbound_call(
+            mock_session,
+            PARTICIPANT_ID,
+            "trial-1",
+        )
 
         assert result["initiated"] is True
         assert result["conversation_id"] == "conv-123"
@@ -179,48 +167,36 @@ class TestInitiateOutboundCall:
 class TestCaptureConsent:
     """Consent capture after disclosure."""
 
-    async def test_captures_consent_flags(self) -> None:
+    async def test_captures_consent_flags(
+        self, mock_session: AsyncMock, participant: MagicMock
+    ) -> None:
         """Records consent flags on the participant."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.consent = {}
-        with patch(
-            "src.agents.outreach.get_participant_by_id",
-            return_value=participant,
-        ):
-            result = await capture_consent(mock_session, uuid.uuid4(), True, True)
+        result = await capture_consent(mock_session, PARTICIPANT_ID, True, True)
         assert result["consent_captured"] is True
 
 
 class TestHandleStopKeyword:
     """STOP keyword handling."""
 
-    async def test_sets_dnc_flag(self) -> None:
+    async def test_sets_dnc_flag(self, mock_session: AsyncMock, participant: MagicMock) -> None:
         """STOP sets DNC flag on the channel."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.dnc_flags = {}
-        with patch(
-            "src.agents.outreach.get_participant_by_id",
-            return_value=participant,
-        ):
-            result = await handle_stop_keyword(mock_session, uuid.uuid4(), "sms")
+        result = await handle_stop_keyword(mock_session, PARTICIPANT_ID, "sms")
         assert result["dnc_applied"] is True
+        assert participant.dnc_flags["sms"] is True
 
 
 class TestLogOutreachAttempt:
     """Outreach attempt event logging."""
 
-    async def test_logs_event(self) -> None:
+    async def test_logs_event(self, mock_session: AsyncMock, mocker: MockerFixture) -> None:
         """Logs an outreach attempt event."""
-        mock_session = AsyncMock()
-        with patch("src.agents.outreach.log_event", return_value=MagicMock()) as mock_log:
-            result = await log_outreach_attempt(
-                mock_session,
-                uuid.uuid4(),
-                "trial-123",
-                "voice",
-                "completed",
-            )
+        mock_log = mocker.patch("src.agents.outreach.log_event", return_value=MagicMock())
+        result = await log_outreach_attempt(
+            mock_session,
+            PARTICIPANT_ID,
+            "trial-123",
+            "voice",
+            "completed",
+        )
         assert result["logged"] is True
         mock_log.assert_awaited_once()
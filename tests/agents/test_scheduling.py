@@ -1,8 +1,13 @@
 """Tests for the scheduling agent function tools."""
 
+from __future__ import annotations
+
 import uuid
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from src.agents.scheduling import (
     book_appointment,
@@ -14,6 +19,16 @@ from src.agents.scheduling import (
     verify_teach_back,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytest_mock import MockerFixture
+
+    from tests.conftest import FakeSession
+
+PARTICIPANT_ID = uuid.UUID(int=1)
+APPOINTMENT_ID = uuid.UUID(int=2)
+
 
 class TestSchedulingAgentDefinition:
     """Scheduling agent is properly configured."""
@@ -30,64 +45,68 @@ class TestSchedulingAgentDefinition:
 class TestCheckGeoEligibility:
     """Geo/distance gate check."""
 
-    async def test_eligible_within_range(self) -> None:
+    async def test_eligible_within_range(
+        self, make_participant: Callable[..., MagicMock], mocker: MockerFixture
+    ) -> None:
         """Participant within max distance is eligible."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.distance_to_site_km = 30.0
+        participant = make_participant(
+            distance_to_site_km=30.0,
+        )
         trial = MagicMock()
         trial.max_distance_km = 80.0
 
-        with (
-            patch("src.agents.scheduling.get_participant_by_id", return_value=participant),
-            patch("src.agents.scheduling.get_trial", return_value=trial),
-        ):
-            result = await check_geo_eligibility(mock_session, uuid.uuid4(), "trial-1")
+        mocker.patch("src.agents.scheduling.get_participant_by_id", return_value=participant)
+        mocker.patch("src.agents.scheduling.get_trial", return_value=trial)
+        result = await check_geo_eligibility(mock_session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
 
-    async def test_ineligible_outside_range(self) -> None:
+    async def test_ineligible_outside_range(
+        self, make_participant: Callable[..., MagicMock], mocker: MockerFixture
+    ) -> None:
         """Participant beyond max distance is ineligible."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.distance_to_site_km = 100.0
+        participant = make_participant(
+            distance_to_site_km=100.0,
+        )
         trial = MagicMock()
         trial.max_distance_km = 80.0
 
-        with (
-            patch("src.agents.scheduling.get_participant_by_id", return_value=participant),
-            patch("src.agents.scheduling.get_trial", return_value=trial),
-        ):
-            result = await check_geo_eligibility(mock_session, uuid.uuid4(), "trial-1")
+        mocker.patch("src.agents.scheduling.get_participant_by_id", return_value=participant)
+        mocker.patch("src.agents.scheduling.get_trial", return_value=trial)
+        result = await check_geo_eligibility(mock_session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is False
 
-    async def test_eligible_when_distance_unknown(self) -> None:
+    async def test_eligible_when_distance_unknown(
+        self, make_participant: Callable[..., MagicMock], mocker: MockerFixture
+    ) -> None:
         """Participant with no distance defaults to eligible."""
         mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.distance_to_site_km = None
+        participant = make_participant(
+            distance_to_site_km=None,
+        )
         trial = MagicMock()
         trial.max_distance_km = 80.0
 
-        with (
-            patch("src.agents.scheduling.get_participant_by_id", return_value=participant),
-            patch("src.agents.scheduling.get_trial", return_value=trial),
-        ):
-            result = await check_geo_eligibility(mock_session, uuid.uuid4(), "trial-1")
+        mocker.patch("src.agents.scheduling.get_participant_by_id", return_value=participant)
+        get_trial_mock = mocker.patch("src.agents.scheduling.get_trial", return_value=trial)
+        result = await check_geo_eligibility(mock_session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
+        get_trial_mock.assert_not_called()
 
 
 class TestFindAvailableSlots:
     """Slot availability query."""
 
-    async def test_returns_slots(self) -> None:
+    async def test_returns_slots(self, mocker: MockerFixture) -> None:
         """Returns a list of available slot datetimes."""
         mock_session = AsyncMock()
         trial = MagicMock()
         trial.operating_hours = {
             "monday": {"open": "08:00", "close": "17:00"},
         }
-        with patch("src.agents.scheduling.get_trial", return_value=trial):
-            result = await find_available_slots(mock_session, "trial-1", ["2026-03-16"])
+        mocker.patch("src.agents.scheduling.get_trial", return_value=trial)
+        result = await find_available_slots(mock_session, "trial-1", ["2026-03-16"])
         assert "slots" in result
         assert isinstance(result["slots"], list)
 
@@ -95,67 +114,60 @@ class TestFindAvailableSlots:
 class TestHoldSlot:
     """Slot hold with SELECT FOR UPDATE."""
 
-    async def test_holds_slot(self) -> None:
+    async def test_holds_slot(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+        mocker: MockerFixture,
+    ) -> None:
         """Returns hold confirmation with expiry time."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-        mock_appointment = MagicMock()
-        mock_appointment.appointment_id = uuid.uuid4()
-
         # No conflict (SELECT FOR UPDATE returns None)
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = result_mock
-
-        with patch(
-            "src.agents.scheduling.create_appointment",
-            return_value=mock_appointment,
-        ):
-            result = await hold_slot(
-                mock_session,
-                uuid.uuid4(),
-                "trial-1",
-                slot_time,
-            )
+        fake_session.push_result(None)
+
+        mocker.patch("src.agents.scheduling.create_appointment", return_value=make_held())
+        result = await hold_slot(
+            fake_session.as_session,
+            PARTICIPANT_ID,
+            "trial-1",
+            slot_time,
+        )
         assert result["held"] is True
         assert "expires_at" in result
         assert "appointment_id" in result
 
-    async def test_rejects_taken_slot(self) -> None:
+    async def test_rejects_taken_slot(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+    ) -> None:
         """Returns held=False when slot is already taken."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-
         # Conflict exists
-        existing = MagicMock()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = existing
-        mock_session.execute.return_value = result_mock
+        fake_session.push_result(make_held())
 
         result = await hold_slot(
-            mock_session,
-            uuid.uuid4(),
+            fake_session.as_session,
+            PARTICIPANT_ID,
             "trial-1",
             slot_time,
         )
         assert result["held"] is False
         assert result["reason"] == "slot_taken"
 
-    async def test_rejects_confirmed_slot(self) -> None:
+    async def test_rejects_confirmed_slot(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+    ) -> None:
         """Returns held=False when slot is already confirmed."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-
         # Confirmed appointment exists at this slot
-        existing = MagicMock()
-        existing.status = "confirmed"
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = existing
-        mock_session.execute.return_value = result_mock
+        fake_session.push_result(make_held("confirmed"))
 
         result = await hold_slot(
-            mock_session,
-            uuid.uuid4(),
+            fake_session.as_session,
+            PARTICIPANT_ID,
             "trial-1",
             slot_time,
         )
@@ -166,77 +178,70 @@ class TestHoldSlot:
 class TestBookAppointment:
     """Appointment booking confirms held appointment."""
 
-    async def test_confirms_held_appointment(self) -> None:
+    async def test_confirms_held_appointment(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+        mocker: MockerFixture,
+    ) -> None:
         """Books by confirming the existing held appointment."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-        held_appointment = MagicMock()
-        held_appointment.appointment_id = uuid.uuid4()
-        held_appointment.status = "held"
-
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = held_appointment
-        mock_session.execute.return_value = result_mock
-
-        with patch("src.agents.scheduling.log_event", return_value=MagicMock()):
-            result = await book_appointment(
-                mock_session,
-                uuid.uuid4(),
-                "trial-1",
-                slot_time,
-                "screening",
-            )
+        held_appointment = make_held()
+        fake_session.push_result(held_appointment)
+
+        mocker.patch("src.agents.scheduling.log_event", return_value=MagicMock())
+        result = await book_appointment(
+            fake_session.as_session,
+            PARTICIPANT_ID,
+            "trial-1",
+            slot_time,
+            "screening",
+        )
         assert result["booked"] is True
         assert "confirmation_due_at" in result
         assert held_appointment.status == "booked"
         assert held_appointment.visit_type == "screening"
 
-    async def test_creates_new_when_no_held(self) -> None:
+    async def test_creates_new_when_no_held(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+        mocker: MockerFixture,
+    ) -> None:
         """Creates new appointment when no held slot and no conflict."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-        mock_appointment = MagicMock()
-        mock_appointment.appointment_id = uuid.uuid4()
-
         # First call: no held appointment for this participant
         # Second call: no conflict from other participants
-        no_result = MagicMock()
-        no_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = no_result
-
-        with (
-            patch(
-                "src.agents.scheduling.create_appointment",
-                return_value=mock_appointment,
-            ),
-            patch("src.agents.scheduling.log_event", return_value=MagicMock()),
-        ):
-            result = await book_appointment(
-                mock_session,
-                uuid.uuid4(),
-                "trial-1",
-                slot_time,
-                "screening",
-            )
+        fake_session.push_result(None)
+        fake_session.push_result(None)
+
+        mocker.patch("src.agents.scheduling.create_appointment", return_value=make_held())
+        mocker.patch("src.agents.scheduling.log_event", return_value=MagicMock())
+        result = await book_appointment(
+            fake_session.as_session,
+            PARTICIPANT_ID,
+            "trial-1",
+            slot_time,
+            "screening",
+        )
         assert result["booked"] is True
         assert "confirmation_due_at" in result
 
-    async def test_rejects_when_other_participant_holds_slot(self) -> None:
+    async def test_rejects_when_other_participant_holds_slot(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        slot_time: datetime,
+    ) -> None:
         """Returns booked=False when another participant holds the slot."""
-        mock_session = AsyncMock()
-        slot_time = datetime.now(UTC) + timedelta(days=7)
-
         # First call: no held appointment for this participant
-        no_held = MagicMock()
-        no_held.scalar_one_or_none.return_value = None
+        fake_session.push_result(None)
         # Second call: conflict — another participant has this slot
-        has_conflict = MagicMock()
-        has_conflict.scalar_one_or_none.return_value = MagicMock()
-        mock_session.execute.side_effect = [no_held, has_conflict]
+        fake_session.push_result(make_held())
 
         result = await book_appointment(
-            mock_session,
-            uuid.uuid4(),
+            fake_session.as_session,
+            PARTICIPANT_ID,
             "trial-1",
             slot_time,
             "screening",
@@ -248,66 +253,56 @@ class TestBookAppointment:
 class TestVerifyTeachBack:
     """Teach-back verification."""
 
-    async def test_passes_with_correct_answers(self) -> None:
-        """Teach-back passes when all answers match."""
-        mock_session = AsyncMock()
-        appointment = MagicMock()
-        appointment.scheduled_at = datetime(2026, 3, 16, 10, 0, tzinfo=UTC)
-        appointment.site_name = "OHSU"
-        appointment.site_address = "3181 SW Sam Jackson"
-        appointment.teach_back_attempts = 0
-
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = appointment
-        mock_session.execute.return_value = result_mock
-
-        result = await verify_teach_back(
-            mock_session,
-            uuid.uuid4(),
-            uuid.uuid4(),
-            "March 16",
-            "10 AM",
-            "OHSU",
+    @pytest.mark.parametrize(
+        ("location", "passed"),
+        [("OHSU", True), ("wrong place", False)],
+        ids=["correct_answers", "wrong_location"],
+    )
+    async def test_teach_back(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        location: str,
+        passed: bool,
+    ) -> None:
+        """Teach-back passes only when every answer matches the booking."""
+        fake_session.push_result(
+            make_held(
+                "booked",
+                scheduled_at=datetime(2026, 3, 16, 10, 0, tzinfo=UTC),
+                site_name="OHSU",
+                site_address="3181 SW Sam Jackson",
+                teach_back_attempts=0,
+            )
         )
-        assert result["passed"] is True
-
-    async def test_fails_with_wrong_location(self) -> None:
-        """Teach-back fails when location answer is wrong."""
-        mock_session = AsyncMock()
-        appointment = MagicMock()
-        appointment.scheduled_at = datetime(2026, 3, 16, 10, 0, tzinfo=UTC)
-        appointment.site_name = "OHSU"
-        appointment.site_address = "3181 SW Sam Jackson"
-        appointment.teach_back_attempts = 0
-
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = appointment
-        mock_session.execute.return_value = result_mock
 
         result = await verify_teach_back(
-            mock_session,
-            uuid.uuid4(),
-            uuid.uuid4(),
+            fake_session.as_session,
+            PARTICIPANT_ID,
+            APPOINTMENT_ID,
             "March 16",
             "10 AM",
-            "wrong place",
+            location,
         )
-        assert result["passed"] is False
+        assert result["passed"] is passed
 
 
 class TestReleaseExpiredSlot:
     """Slot expiry and release."""
 
-    async def test_releases_expired_slot(self) -> None:
+    async def test_releases_expired_slot(
+        self,
+        fake_session: FakeSession,
+        make_held: Callable[..., MagicMock],
+        now: datetime,
+    ) -> None:
         """Expired slot is marked as released."""
-        mock_session = AsyncMock()
-        appointment = MagicMock()
-        appointment.status = "booked"
-        appointment.slot_held_until = datetime.now(UTC) - timedelta(hours=1)
-
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = appointment
-        mock_session.execute.return_value = result_mock
+        fake_session.push_result(
+            make_held(
+                "booked",
+                slot_held_until=now - timedelta(hours=1),
+            )
+        )
 
-        result = await release_expired_slot(mock_session, uuid.uuid4())
+        result = await release_expired_slot(fake_session.as_session, PARTICIPANT_ID)
         assert result["released"] is True
@@ -1,6 +1,7 @@
 """Tests for the screening agent function tools."""
 
 import uuid
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.agents.screening import (
@@ -12,6 +13,8 @@ from src.agents.screening import (
     screening_agent,
 )
 
+PARTICIPANT_ID = uuid.UUID(int=1)
+
 
 class TestScreeningAgentDefinition:
     """Screening agent is properly configured."""
@@ -64,7 +67,7 @@ class TestCheckHardExcludes:
         ):
             result = await check_hard_excludes(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "trial-1",
                 {"pregnant_or_nursing": True},
             )
@@ -82,12 +85,38 @@ class TestCheckHardExcludes:
         ):
             result = await check_hard_excludes(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "trial-1",
                 {"pregnant_or_nursing": False},
             )
         assert result["excluded"] is False
 
+    async def test_matched_criteria_follow_trial_order(self) -> None:
+        """Matches are reported in criteria order; unrelated answers are ignored."""
+        mock_session = AsyncMock()
+        with patch(
+            "src.agents.screening.get_trial_criteria",
+            return_value={
+                "inclusion": {},
+                "exclusion": {"on_dialysis": True, "pregnant_or_nursing": True, "bmi": 40},
+            },
+        ):
+            result = await check_hard_excludes(
+                mock_session,
+                PARTICIPANT_ID,
+                "trial-1",
+                {
+                    "pregnant_or_nursing": True,
+                    "on_dialysis": True,
+                    "bmi": 30,
+                    "medications": ["metformin"],
+                },
+            )
+        assert result == {
+            "excluded": True,
+            "matched_criteria": ["on_dialysis", "pregnant_or_nursing"],
+        }
+
 
 class TestRecordScreeningResponse:
     """Screening response recording."""
@@ -95,16 +124,12 @@ class TestRecordScreeningResponse:
     async def test_records_response(self) -> None:
         """Records a screening response with provenance."""
         mock_session = AsyncMock()
-        pt = MagicMock()
-        pt.screening_responses = {}
-
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = pt
-        mock_session.execute.return_value = result_mock
+        pt = SimpleNamespace(screening_responses={})
+        mock_session.execute.return_value = SimpleNamespace(scalar_one_or_none=lambda: pt)
 
         result = await record_screening_response(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
             "age",
             "45",
@@ -116,19 +141,18 @@ class TestRecordScreeningResponse:
 class TestDetermineEligibility:
     """Eligibility determination with real nested response format."""
 
-    def _make_pt(self, responses: dict) -> MagicMock:
-        """Create a mock participant_trial with screening responses."""
-        pt = MagicMock()
-        pt.screening_responses = responses
-        pt.eligibility_status = "pending"
-        return pt
+    def _make_pt(self, responses: dict) -> SimpleNamespace:
+        """Create a stub participant_trial with screening responses."""
+        return SimpleNamespace(screening_responses=responses, eligibility_status="pending")
+
+    def _make_session(self, pt: SimpleNamespace) -> AsyncMock:
+        """Create a mock session whose only query returns the given participant_trial.
 
-    def _make_session(self, pt: MagicMock) -> AsyncMock:
-        """Create a mock session that returns the given participant_trial."""
+        Wired as a one-item ``side_effect`` so any extra query fails loudly
+        instead of silently reusing the same result.
+        """
         session = AsyncMock()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = pt
-        session.execute.return_value = result_mock
+        session.execute.side_effect = [SimpleNamespace(scalar_one_or_none=lambda: pt)]
         return session
 
     def _resp(self, answer: str, provenance: str = "patient_stated") -> dict:
@@ -156,8 +180,9 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
+        assert session.execute.await_count == 1
 
     async def test_excluded_by_affirmative_answer(self) -> None:
         """Returns ineligible when participant answers yes to exclusion."""
@@ -172,7 +197,7 @@ class TestDetermineEligibility:
                 "exclusion": {"pregnant_or_nursing": True},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is False
         assert "pregnant_or_nursing" in result.get("reason", "")
 
@@ -189,7 +214,7 @@ class TestDetermineEligibility:
                 "exclusion": {"pregnant_or_nursing": True},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
 
     async def test_age_below_minimum_ineligible(self) -> None:
@@ -205,7 +230,7 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is False
 
     async def test_age_above_maximum_ineligible(self) -> None:
@@ -221,7 +246,7 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is False
 
     async def test_missing_responses_returns_incomplete(self) -> None:
@@ -235,7 +260,7 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is False
         assert "missing" in result.get("reason", "").lower()
 
@@ -252,7 +277,7 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
 
     async def test_diagnosis_match(self) -> None:
@@ -268,7 +293,7 @@ class TestDetermineEligibility:
                 "exclusion": {},
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
 
     async def test_full_diabetes_trial_eligible(self) -> None:
@@ -301,7 +326,7 @@ class TestDetermineEligibility:
                 },
             },
         ):
-            result = await determine_eligibility(session, uuid.uuid4(), "trial-1")
+            result = await determine_eligibility(session, PARTICIPANT_ID, "trial-1")
         assert result["eligible"] is True
 
 
@@ -319,7 +344,7 @@ class TestRecordCaregiverInfo:
         ):
             result = await record_caregiver_info(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "Maria Garcia",
                 "daughter",
                 "scheduling",
@@ -338,7 +363,7 @@ class TestRecordCaregiverInfo:
         ):
             await record_caregiver_info(
                 mock_session,
-                uuid.uuid4(),
+                PARTICIPANT_ID,
                 "John Smith",
                 "spouse",
                 "all",
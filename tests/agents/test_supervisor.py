@@ -3,8 +3,11 @@
 Tests the internal audit functions with mocked sessions.
 """
 
+from __future__ import annotations
+
 import uuid
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 from src.agents.supervisor import (
     audit_provenance,
@@ -14,6 +17,15 @@ from src.agents.supervisor import (
     supervisor_agent,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+CONVERSATION_ID = uuid.UUID(int=1)
+PARTICIPANT_ID = uuid.UUID(int=2)
+
 
 class TestSupervisorAgentDefinition:
     """Supervisor agent is properly configured."""
@@ -30,82 +42,80 @@ class TestSupervisorAgentDefinition:
 class TestAuditTranscript:
     """Transcript compliance audit."""
 
-    async def test_audit_compliant_transcript(self) -> None:
+    async def test_audit_compliant_transcript(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Transcript with all required steps returns risk_level=LOW."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "..."},
-                {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "..."},
-                {
-                    "step": "identity_verified",
-                    "timestamp": "2026-01-01T10:02:00",
-                    "content": "...",
-                },
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await audit_transcript(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "..."},
+                    {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "..."},
+                    {
+                        "step": "identity_verified",
+                        "timestamp": "2026-01-01T10:02:00",
+                        "content": "...",
+                    },
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await audit_transcript(mock_session, CONVERSATION_ID)
         assert result["compliant"] is True
         assert result["risk_level"] == "LOW"
         assert result["missing_steps"] == []
 
-    async def test_audit_missing_disclosure(self) -> None:
+    async def test_audit_missing_disclosure(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Transcript missing disclosure returns risk_level=HIGH."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "..."},
-                {
-                    "step": "identity_verified",
-                    "timestamp": "2026-01-01T10:02:00",
-                    "content": "...",
-                },
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await audit_transcript(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "..."},
+                    {
+                        "step": "identity_verified",
+                        "timestamp": "2026-01-01T10:02:00",
+                        "content": "...",
+                    },
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await audit_transcript(mock_session, CONVERSATION_ID)
         assert result["compliant"] is False
         assert result["risk_level"] == "HIGH"
         assert "disclosure" in result["missing_steps"]
 
-    async def test_audit_handles_entries_without_step_key(self) -> None:
+    async def test_audit_handles_entries_without_step_key(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Entries missing step key are skipped, not KeyError."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"step": "disclosure", "content": "..."},
-                {"content": "some text without step"},
-                {"step": "consent", "content": "..."},
-                {"step": "identity_verified", "content": "..."},
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await audit_transcript(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"step": "disclosure", "content": "..."},
+                    {"content": "some text without step"},
+                    {"step": "consent", "content": "..."},
+                    {"step": "identity_verified", "content": "..."},
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await audit_transcript(mock_session, CONVERSATION_ID)
         assert result["compliant"] is True
 
-    async def test_audit_handles_empty_transcript(self) -> None:
+    async def test_audit_handles_empty_transcript(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Empty transcript returns non-compliant without crashing."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {"entries": []}
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await audit_transcript(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(full_transcript={"entries": []})
+        mock_session = session_returning(conversation)
+
+        result = await audit_transcript(mock_session, CONVERSATION_ID)
         assert result["compliant"] is False
         assert len(result["missing_steps"]) == 3
 
@@ -113,72 +123,76 @@ class TestAuditTranscript:
 class TestCheckPhiLeak:
     """PHI leak detection in transcripts."""
 
-    async def test_phi_leak_detected_before_identity(self) -> None:
+    async def test_phi_leak_detected_before_identity(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """PHI keyword before identity_verified step flags phi_leaked=True."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "..."},
-                {
-                    "step": "screening",
-                    "timestamp": "2026-01-01T10:01:00",
-                    "content": "discussed date of birth details",
-                },
-                {
-                    "step": "identity_verified",
-                    "timestamp": "2026-01-01T10:02:00",
-                    "content": "...",
-                },
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await check_phi_leak(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "..."},
+                    {
+                        "step": "screening",
+                        "timestamp": "2026-01-01T10:01:00",
+                        "content": "discussed date of birth details",
+                    },
+                    {
+                        "step": "identity_verified",
+                        "timestamp": "2026-01-01T10:02:00",
+                        "content": "...",
+                    },
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await check_phi_leak(mock_session, CONVERSATION_ID)
         assert result["phi_leaked"] is True
         assert len(result["details"]) > 0
 
-    async def test_no_phi_leak_in_compliant_call(self) -> None:
+    async def test_no_phi_leak_in_compliant_call(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """PHI only after identity_verified step returns phi_leaked=False."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "hello"},
-                {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "yes"},
-                {"step": "identity_verified", "timestamp": "2026-01-01T10:02:00", "content": "ok"},
-                {
-                    "step": "screening",
-                    "timestamp": "2026-01-01T10:03:00",
-                    "content": "date of birth confirmed as correct",
-                },
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await check_phi_leak(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"step": "disclosure", "timestamp": "2026-01-01T10:00:00", "content": "hello"},
+                    {"step": "consent", "timestamp": "2026-01-01T10:01:00", "content": "yes"},
+                    {
+                        "step": "identity_verified",
+                        "timestamp": "2026-01-01T10:02:00",
+                        "content": "ok",
+                    },
+                    {
+                        "step": "screening",
+                        "timestamp": "2026-01-01T10:03:00",
+                        "content": "date of birth confirmed as correct",
+                    },
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await check_phi_leak(mock_session, CONVERSATION_ID)
         assert result["phi_leaked"] is False
         assert result["details"] == []
 
-    async def test_phi_leak_handles_entries_without_step(self) -> None:
+    async def test_phi_leak_handles_entries_without_step(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Entries missing step key don't crash PHI scan."""
-        mock_session = AsyncMock()
-        conversation = MagicMock()
-        conversation.full_transcript = {
-            "entries": [
-                {"content": "discussed date of birth details"},
-                {"step": "identity_verified", "content": "ok"},
-            ]
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = conversation
-        mock_session.execute.return_value = result_mock
-
-        result = await check_phi_leak(mock_session, uuid.uuid4())
+        conversation = SimpleNamespace(
+            full_transcript={
+                "entries": [
+                    {"content": "discussed date of birth details"},
+                    {"step": "identity_verified", "content": "ok"},
+                ]
+            },
+        )
+        mock_session = session_returning(conversation)
+
+        result = await check_phi_leak(mock_session, CONVERSATION_ID)
         assert result["phi_leaked"] is True
         assert len(result["details"]) > 0
 
@@ -186,45 +200,45 @@ class TestCheckPhiLeak:
 class TestDetectAnswerInconsistencies:
     """Screening answer inconsistency detection."""
 
-    async def test_inconsistent_answers_detected(self) -> None:
+    async def test_inconsistent_answers_detected(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Same question answered differently by different sources is flagged."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": [
-                {"answer": "type_2", "provenance": "patient_stated"},
-                {"answer": "type_1", "provenance": "ehr"},
-            ],
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": [
+                    {"answer": "type_2", "provenance": "patient_stated"},
+                    {"answer": "type_1", "provenance": "ehr"},
+                ],
+            },
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await detect_answer_inconsistencies(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["inconsistencies_found"] is True
         assert "diagnosis" in result["flagged_questions"]
 
-    async def test_consistent_answers_clean(self) -> None:
+    async def test_consistent_answers_clean(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """All answers consistent across sources returns clean."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": [
-                {"answer": "type_2", "provenance": "patient_stated"},
-                {"answer": "type_2", "provenance": "ehr"},
-            ],
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": [
+                    {"answer": "type_2", "provenance": "patient_stated"},
+                    {"answer": "type_2", "provenance": "ehr"},
+                ],
+            },
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await detect_answer_inconsistencies(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["inconsistencies_found"] is False
@@ -234,41 +248,41 @@ class TestDetectAnswerInconsistencies:
 class TestAuditProvenance:
     """Provenance validation for screening responses."""
 
-    async def test_all_provenance_present(self) -> None:
+    async def test_all_provenance_present(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """All responses have valid provenance returns all_valid=True."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": {"answer": "type_2", "provenance": "patient_stated"},
-            "medication": {"answer": "metformin", "provenance": "ehr"},
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": {"answer": "type_2", "provenance": "patient_stated"},
+                "medication": {"answer": "metformin", "provenance": "ehr"},
+            },
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await audit_provenance(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["all_valid"] is True
         assert result["missing_provenance"] == []
 
-    async def test_missing_provenance_flagged(self) -> None:
+    async def test_missing_provenance_flagged(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Response without provenance field is flagged."""
-        mock_session = AsyncMock()
-        participant_trial = MagicMock()
-        participant_trial.screening_responses = {
-            "diagnosis": {"answer": "type_2", "provenance": "patient_stated"},
-            "medication": {"answer": "metformin"},
-        }
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = participant_trial
-        mock_session.execute.return_value = result_mock
+        participant_trial = SimpleNamespace(
+            screening_responses={
+                "diagnosis": {"answer": "type_2", "provenance": "patient_stated"},
+                "medication": {"answer": "metformin"},
+            },
+        )
+        mock_session = session_returning(participant_trial)
 
         result = await audit_provenance(
             mock_session,
-            uuid.uuid4(),
+            PARTICIPANT_ID,
             "trial-1",
         )
         assert result["all_valid"] is False
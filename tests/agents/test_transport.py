@@ -1,8 +1,14 @@
 """Tests for the transport agent function tools."""
 
+from __future__ import annotations
+
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
 
 from src.agents.transport import (
     book_transport,
@@ -11,6 +17,28 @@ from src.agents.transport import (
     transport_agent,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tests.conftest import FakeSession
+
+PARTICIPANT_ID = uuid.UUID(int=1)
+APPOINTMENT_ID = uuid.UUID(int=2)
+RIDE_ID = uuid.UUID(int=3)
+
+ADDRESS_ON_FILE = SimpleNamespace(
+    address_street="123 Main St",
+    address_city="Portland",
+    address_state="OR",
+    address_zip="97201",
+)
+ADDRESS_LINE = (
+    f"{ADDRESS_ON_FILE.address_street}, {ADDRESS_ON_FILE.address_city},"
+    f" {ADDRESS_ON_FILE.address_state} {ADDRESS_ON_FILE.address_zip}"
+)
+
 
 class TestTransportAgentDefinition:
     """Transport agent is properly configured."""
@@ -27,43 +55,55 @@ class TestTransportAgentDefinition:
 class TestConfirmPickupAddress:
     """Pickup address confirmation."""
 
-    async def test_confirms_address(self) -> None:
-        """Confirms pickup address against participant record."""
-        mock_session = AsyncMock()
-        participant = MagicMock()
-        participant.address_street = "123 Main St"
-        participant.address_city = "Portland"
-        participant.address_state = "OR"
-        participant.address_zip = "97201"
+    @pytest.fixture(autouse=True)
+    def participant_on_file(self) -> Iterator[SimpleNamespace]:
+        """Serve ADDRESS_ON_FILE from the participant lookup.
+
+        Yields:
+            The participant stub returned by get_participant_by_id.
+        """
         with patch(
             "src.agents.transport.get_participant_by_id",
-            return_value=participant,
+            return_value=ADDRESS_ON_FILE,
         ):
-            result = await confirm_pickup_address(mock_session, uuid.uuid4(), "123 Main St")
+            yield ADDRESS_ON_FILE
+
+    async def test_confirms_address(self, fake_session: FakeSession) -> None:
+        """Confirms pickup address against participant record."""
+        result = await confirm_pickup_address(
+            fake_session.as_session, PARTICIPANT_ID, "123 Main St"
+        )
         assert result["confirmed"] is True
+        assert result["address_on_file"] == ADDRESS_LINE
+        assert result["is_match"] is True
+
+    async def test_flags_different_address(self, fake_session: FakeSession) -> None:
+        """A pickup address that differs from the record is not a match."""
+        result = await confirm_pickup_address(
+            fake_session.as_session, PARTICIPANT_ID, "999 Elm St, Salem, OR 97301"
+        )
+        assert result["address_on_file"] == ADDRESS_LINE
+        assert result["is_match"] is False
 
 
 class TestBookTransport:
     """Transport booking."""
 
-    async def test_books_ride(self) -> None:
+    async def test_books_ride(self, session_returning: Callable[[object], AsyncSession]) -> None:
         """Books a ride and creates a ride record."""
-        mock_session = AsyncMock()
-        mock_ride = MagicMock()
-        mock_ride.ride_id = uuid.uuid4()
-        appointment = MagicMock()
-        appointment.site_address = "456 Oak Ave"
-        appointment.scheduled_at = datetime(2026, 3, 16, 10, 0, tzinfo=UTC)
+        mock_ride = SimpleNamespace(ride_id=RIDE_ID)
+        appointment = SimpleNamespace(
+            site_address="456 Oak Ave",
+            scheduled_at=datetime(2026, 3, 16, 10, 0, tzinfo=UTC),
+        )
 
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = appointment
-        mock_session.execute.return_value = result_mock
+        mock_session = session_returning(appointment)
 
         with patch("src.agents.transport.create_ride", return_value=mock_ride):
             result = await book_transport(
                 mock_session,
-                uuid.uuid4(),
-                uuid.uuid4(),
+                PARTICIPANT_ID,
+                APPOINTMENT_ID,
                 "123 Main St, Portland OR 97201",
             )
         assert result["booked"] is True
@@ -71,15 +111,15 @@ class TestBookTransport:
         assert result["dropoff_address"] == "456 Oak Ave"
         assert "scheduled_pickup_at" in result
 
-    async def test_returns_error_when_appointment_not_found(self) -> None:
+    async def test_returns_error_when_appointment_not_found(
+        self, fake_session: FakeSession
+    ) -> None:
         """Returns error when appointment does not exist."""
-        mock_session = AsyncMock()
-
         with patch("src.agents.transport.get_appointment", return_value=None):
             result = await book_transport(
-                mock_session,
-                uuid.uuid4(),
-                uuid.uuid4(),
+                fake_session.as_session,
+                PARTICIPANT_ID,
+                APPOINTMENT_ID,
                 "123 Main St, Portland OR 97201",
             )
         assert result == {"error": "appointment_not_found"}
@@ -88,16 +128,16 @@ class TestBookTransport:
 class TestCheckRideStatus:
     """Ride status check."""
 
-    async def test_returns_status(self) -> None:
+    async def test_returns_status(
+        self, session_returning: Callable[[object], AsyncSession]
+    ) -> None:
         """Returns current ride status."""
-        mock_session = AsyncMock()
-        ride = MagicMock()
-        ride.status = "confirmed"
-        ride.uber_ride_id = "mock-ride-123"
+        ride = SimpleNamespace(
+            status="confirmed",
+            uber_ride_id="mock-ride-123",
+        )
 
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = ride
-        mock_session.execute.return_value = result_mock
+        mock_session = session_returning(ride)
 
-        result = await check_ride_status(mock_session, uuid.uuid4())
+        result = await check_ride_status(mock_session, RIDE_ID)
         assert result["status"] == "confirmed"
@@ -1,291 +1,149 @@
 """Tests for scheduling-related webhook handlers (check_availability, book_appointment)."""
 
+import types
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from httpx import ASGITransport, AsyncClient
 
-from src.api.app import create_app
+PARTICIPANT_ID = uuid.UUID(int=1)
+APPOINTMENT_ID = uuid.UUID(int=2)
+EVENT_ID = uuid.UUID(int=3)
 
+WEBHOOK_PATCH_TARGETS = {
+    "find_available_slots": "src.api.webhooks.find_available_slots",
+    "book_appointment": "src.api.webhooks.book_appointment",
+    "record_screening_response": "src.api.webhooks.record_screening_response",
+    "determine_eligibility": "src.api.webhooks.determine_eligibility",
+    "log_event": "src.api.webhooks.log_event",
+    "broadcast_event": "src.api.webhooks.broadcast_event",
+    "get_trial": "src.db.trials.get_trial",
+}
 
-@pytest.fixture
-def app():
-    """Create test FastAPI app."""
-    return create_app()
-
-
-class TestCheckAvailabilityHandler:
-    """check_availability server tool handler."""
-
-    async def test_returns_available_slots(self, app) -> None:
-        """Handler calls find_available_slots and returns slots."""
-        participant_id = str(uuid.uuid4())
-        mock_slots = {"slots": ["2026-03-10T09:00:00", "2026-03-11T09:00:00"]}
-
-        with (
-            patch(
-                "src.api.webhooks.find_available_slots",
-                new_callable=AsyncMock,
-                return_value=mock_slots,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=None,
-            ),
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                response = await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "check_availability",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                            "preferred_dates": ["2026-03-10", "2026-03-11"],
-                        },
-                    },
-                )
-        assert response.status_code == 200
-        data = response.json()
-        assert "slots" in data
-        assert len(data["slots"]) == 2
-
-    async def test_broadcasts_availability_checked_event(self, app) -> None:
-        """Handler broadcasts availability_checked via WebSocket."""
-        participant_id = str(uuid.uuid4())
-        mock_slots = {"slots": ["2026-03-10T09:00:00"]}
-
-        mock_event = MagicMock()
-        mock_event.event_id = uuid.uuid4()
-        mock_event.created_at = "2026-03-01T00:00:00"
-
-        with (
-            patch(
-                "src.api.webhooks.find_available_slots",
-                new_callable=AsyncMock,
-                return_value=mock_slots,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=mock_event,
-            ),
-            patch(
-                "src.api.webhooks.broadcast_event",
-                new_callable=AsyncMock,
-            ) as mock_broadcast,
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "check_availability",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                            "preferred_dates": ["2026-03-10"],
-                        },
-                    },
-                )
-        mock_broadcast.assert_called_once()
-        broadcast_data = mock_broadcast.call_args[0][0]["data"]
-        assert broadcast_data["event_type"] == "availability_checked"
 
+@pytest.fixture
+def webhook_mocks(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    """Rebind webhook dependencies to AsyncMocks for one test.
+
+    Tests configure per-case behaviour through the returned namespace,
+    e.g. ``webhook_mocks.find_available_slots.return_value = ...``.
+
+    Returns:
+        Namespace holding one AsyncMock per patched dependency.
+    """
+    store = types.SimpleNamespace()
+    for name, target in WEBHOOK_PATCH_TARGETS.items():
+        mock = AsyncMock(return_value=None)
+        monkeypatch.setattr(target, mock)
+        setattr(store, name, mock)
+    return store
+
+
+@dataclass(frozen=True)
+class ServerToolCase:
+    """One server-tool request and the handler behaviour it expects."""
+
+    tool_name: str
+    handler: str
+    handler_result: dict
+    parameters: dict
+    expected_event_type: str | None = None
+
+    @property
+    def body(self) -> dict:
+        """Build the webhook JSON body for this case."""
+        return {
+            "tool_name": self.tool_name,
+            "conversation_id": "conv-123",
+            "parameters": {
+                "participant_id": str(PARTICIPANT_ID),
+                "trial_id": "diabetes-study-a",
+                **self.parameters,
+            },
+        }
 
-class TestBookAppointmentHandler:
-    """book_appointment server tool handler."""
 
-    async def test_books_appointment_and_returns_result(self, app) -> None:
-        """Handler calls book_appointment and returns booking result."""
-        participant_id = str(uuid.uuid4())
-        mock_result = {
+BOOKING_PARAMETERS = {"slot_datetime": "2026-03-10T09:00:00", "visit_type": "screening"}
+
+SERVER_TOOL_CASES = [
+    ServerToolCase(
+        tool_name="check_availability",
+        handler="find_available_slots",
+        handler_result={"slots": ["2026-03-10T09:00:00", "2026-03-11T09:00:00"]},
+        parameters={"preferred_dates": ["2026-03-10", "2026-03-11"]},
+    ),
+    ServerToolCase(
+        tool_name="check_availability",
+        handler="find_available_slots",
+        handler_result={"slots": ["2026-03-10T09:00:00"]},
+        parameters={"preferred_dates": ["2026-03-10"]},
+        expected_event_type="availability_checked",
+    ),
+    ServerToolCase(
+        tool_name="book_appointment",
+        handler="book_appointment",
+        handler_result={
             "booked": True,
-            "appointment_id": str(uuid.uuid4()),
+            "appointment_id": str(APPOINTMENT_ID),
             "confirmation_due_at": "2026-03-10T21:00:00+00:00",
-        }
-
-        with (
-            patch(
-                "src.api.webhooks.book_appointment",
-                new_callable=AsyncMock,
-                return_value=mock_result,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=None,
-            ),
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                response = await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "book_appointment",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                            "slot_datetime": "2026-03-10T09:00:00",
-                            "visit_type": "screening",
-                        },
-                    },
-                )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["booked"] is True
-        assert "appointment_id" in data
-
-    async def test_broadcasts_appointment_booked_event(self, app) -> None:
-        """Handler broadcasts appointment_booked via WebSocket."""
-        participant_id = str(uuid.uuid4())
-        appointment_id = str(uuid.uuid4())
-        mock_result = {
+        },
+        parameters=BOOKING_PARAMETERS,
+    ),
+    ServerToolCase(
+        tool_name="book_appointment",
+        handler="book_appointment",
+        handler_result={
             "booked": True,
-            "appointment_id": appointment_id,
+            "appointment_id": str(APPOINTMENT_ID),
             "confirmation_due_at": "2026-03-10T21:00:00+00:00",
-        }
-
-        mock_event = MagicMock()
-        mock_event.event_id = uuid.uuid4()
-        mock_event.created_at = "2026-03-01T00:00:00"
-
-        with (
-            patch(
-                "src.api.webhooks.book_appointment",
-                new_callable=AsyncMock,
-                return_value=mock_result,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=mock_event,
-            ),
-            patch(
-                "src.api.webhooks.broadcast_event",
-                new_callable=AsyncMock,
-            ) as mock_broadcast,
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "book_appointment",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                            "slot_datetime": "2026-03-10T09:00:00",
-                            "visit_type": "screening",
-                        },
-                    },
-                )
-        mock_broadcast.assert_called_once()
-        broadcast_data = mock_broadcast.call_args[0][0]["data"]
-        assert broadcast_data["event_type"] == "appointment_booked"
-
-
-class TestToolAliases:
-    """ElevenLabs prompt-name aliases route to correct handlers."""
-
-    async def test_record_screening_answer_alias(self, app) -> None:
-        """record_screening_answer routes to record_screening_response."""
-        participant_id = str(uuid.uuid4())
-        mock_result = {"recorded": True}
-
-        with (
-            patch(
-                "src.api.webhooks.record_screening_response",
-                new_callable=AsyncMock,
-                return_value=mock_result,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=None,
-            ),
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                response = await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "record_screening_answer",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                            "question_key": "has_diabetes",
-                            "answer": "yes",
-                        },
-                    },
-                )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["recorded"] is True
-
-    async def test_check_eligibility_alias(self, app) -> None:
-        """check_eligibility routes to determine_eligibility."""
-        participant_id = str(uuid.uuid4())
-        mock_result = {"eligible": True, "status": "eligible"}
-        mock_trial = MagicMock()
-        mock_trial.trial_name = "Diabetes Study A"
-
-        with (
-            patch(
-                "src.api.webhooks.determine_eligibility",
-                new_callable=AsyncMock,
-                return_value=mock_result,
-            ),
-            patch(
-                "src.api.webhooks.log_event",
-                new_callable=AsyncMock,
-                return_value=None,
-            ),
-            patch(
-                "src.db.trials.get_trial",
-                new_callable=AsyncMock,
-                return_value=mock_trial,
-            ),
-        ):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(
-                transport=transport,
-                base_url="http://test",
-            ) as client:
-                response = await client.post(
-                    "/webhooks/elevenlabs/server-tool",
-                    json={
-                        "tool_name": "check_eligibility",
-                        "conversation_id": "conv-123",
-                        "parameters": {
-                            "participant_id": participant_id,
-                            "trial_id": "diabetes-study-a",
-                        },
-                    },
-                )
-        assert response.status_code == 200
-        data = response.json()
-        assert data["eligible"] is True
+        },
+        parameters=BOOKING_PARAMETERS,
+        expected_event_type="appointment_booked",
+    ),
+    # Aliases: ElevenLabs prompt names route to the canonical handlers
+    ServerToolCase(
+        tool_name="record_screening_answer",
+        handler="record_screening_response",
+        handler_result={"recorded": True},
+        parameters={"question_key": "has_diabetes", "answer": "yes"},
+    ),
+    ServerToolCase(
+        tool_name="check_eligibility",
+        handler="determine_eligibility",
+        handler_result={"eligible": True, "status": "eligible"},
+        parameters={},
+    ),
+]
+
+
+def _build_mock_event() -> MagicMock:
+    """Build a persisted-event stand-in so broadcasts fire."""
+    mock_event = MagicMock()
+    mock_event.event_id = EVENT_ID
+    mock_event.created_at = "2026-03-01T00:00:00"
+    return mock_event
+
+
+def _case_id(case: ServerToolCase) -> str:
+    """Name a parametrized case after its tool and broadcast expectation."""
+    suffix = "broadcast" if case.expected_event_type else "result"
+    return f"{case.tool_name}-{suffix}"
+
+
+@pytest.mark.parametrize("case", SERVER_TOOL_CASES, ids=_case_id)
+async def test_server_tool(asgi_client, webhook_mocks, case: ServerToolCase) -> None:
+    """Tool routes to its handler, returns its result, and broadcasts if logged."""
+    getattr(webhook_mocks, case.handler).return_value = case.handler_result
+    if case.expected_event_type is not None:
+        webhook_mocks.log_event.return_value = _build_mock_event()
+
+    response = await asgi_client.post("/webhooks/elevenlabs/server-tool", json=case.body)
+
+    assert response.status_code == 200
+    assert response.json() == case.handler_result
+    getattr(webhook_mocks, case.handler).assert_awaited_once()
+    if case.expected_event_type is not None:
+        webhook_mocks.broadcast_event.assert_called_once()
+        broadcast_data = webhook_mocks.broadcast_event.call_args[0][0]["data"]
+        assert broadcast_data["event_type"] == case.expected_event_type
@@ -1,8 +1,72 @@
 """Shared test fixtures for Ask Mary test suite."""
 
+import asyncio
+import contextlib
+import importlib.util
+import os
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
 import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import Connection, Engine
+from sqlalchemy import event as sa_event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
+from src.api.app import create_app
 from src.config.settings import Settings
+from src.db.models import Base
+from src.shared.safety_gate import warmup as warmup_safety_gate
+
+# uvloop is not built for Windows
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+SQLITE_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+StatementCapture = Callable[[Engine | Connection], contextlib.AbstractContextManager[list[str]]]
+
+# Placeholder suites for services without test credentials; not even
+# imported unless explicitly requested.
+collect_ignore_glob = []
+if not os.getenv("RUN_EXTERNAL_INTEGRATION"):
+    collect_ignore_glob = [
+        "integration/test_databricks_connection.py",
+        "integration/test_google_calendar.py",
+    ]
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_for_sqlite(type_: JSONB, compiler: object, **kw: object) -> str:
+    """Render Postgres JSONB columns as SQLite JSON for in-memory tests."""
+    return "JSON"
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the session-wide test loop on uvloop, matching uvicorn[standard].
+
+    Returns:
+        uvloop's policy when installed, else the default asyncio policy.
+    """
+    if not HAS_UVLOOP:
+        return asyncio.get_event_loop_policy()
+    import uvloop
+
+    return cast("asyncio.AbstractEventLoopPolicy", uvloop.EventLoopPolicy())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_safety_gate() -> None:
+    """Pay the safety gate's one-time setup before any latency test runs."""
+    warmup_safety_gate()
 
 
 @pytest.fixture
@@ -19,3 +83,201 @@ def settings() -> Settings:
         mary_id_pepper="test-pepper-do-not-use-in-production",
         openai_api_key="sk-test-fake-key",
     )
+
+
+class FakeResult:
+    """Minimal query-result stand-in returned by FakeSession.execute().
+
+    Supports the two access paths the code under test uses,
+    ``scalar_one_or_none()`` and ``scalars().all()``, without building
+    a MagicMock and its child mocks for every queued result.
+    """
+
+    __slots__ = ("_rows", "_scalar")
+
+    def __init__(self, scalar: object = None, rows: list[Any] | None = None) -> None:
+        self._scalar = scalar
+        self._rows = rows or []
+
+    def scalar_one_or_none(self) -> object:
+        """Return the queued scalar."""
+        return self._scalar
+
+    def scalars(self) -> "FakeResult":
+        """Return this result; ``all()`` then yields the queued rows."""
+        return self
+
+    def all(self) -> list[Any]:
+        """Return the queued rows."""
+        return self._rows
+
+
+class FakeSession:
+    """Lightweight async session stand-in for repository unit tests.
+
+    Exposes only the methods the db layer calls, without AsyncMock's
+    per-attribute child mocks and call recording. Await counts are kept
+    as plain integers, and queued results are consumed from a deque in
+    FIFO order.
+
+    Pass ``as_session`` to code under test, which is typed against
+    AsyncSession; the counters and ``push_result`` stay on the fake.
+    """
+
+    def __init__(self) -> None:
+        self.add = MagicMock()
+        self.flush_count = 0
+        self.commit_count = 0
+        self.execute_count = 0
+        self._exec_results: deque[FakeResult] = deque()
+
+    @property
+    def as_session(self) -> AsyncSession:
+        """Return this fake typed as the AsyncSession it stands in for."""
+        return cast("AsyncSession", self)
+
+    async def flush(self) -> None:
+        """Record a flush."""
+        self.flush_count += 1
+
+    async def commit(self) -> None:
+        """Record a commit."""
+        self.commit_count += 1
+
+    async def execute(self, *_args: object) -> FakeResult | MagicMock:
+        """Return the next preloaded result, or a bare MagicMock.
+
+        Returns:
+            Result stand-in for the executed statement.
+        """
+        self.execute_count += 1
+        if self._exec_results:
+            return self._exec_results.popleft()
+        return MagicMock()
+
+    def push_result(self, scalar: object = None, rows: list[Any] | None = None) -> FakeResult:
+        """Preload the result returned by the next execute() call.
+
+        Args:
+            scalar: Value for ``scalar_one_or_none()``.
+            rows: Values for ``scalars().all()``.
+
+        Returns:
+            The queued result.
+        """
+        result = FakeResult(scalar, rows)
+        self._exec_results.append(result)
+        return result
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    """Provide a fresh lightweight async session stub.
+
+    Returns:
+        FakeSession with no preloaded results.
+    """
+    return FakeSession()
+
+
+@pytest.fixture
+def gcs_mocks(mocker: MockerFixture) -> SimpleNamespace:
+    """Patch storage.Client with a client -> bucket -> blob mock chain.
+
+    Returns:
+        SimpleNamespace with the ``client``, ``bucket`` and ``blob`` mocks.
+    """
+    blob = MagicMock()
+    bucket = MagicMock()
+    bucket.blob.return_value = blob
+    client = MagicMock()
+    client.bucket.return_value = bucket
+    mocker.patch("src.services.gcs_client.storage.Client", return_value=client)
+    return SimpleNamespace(client=client, bucket=bucket, blob=blob)
+
+
+@contextlib.contextmanager
+def _capture_statements(target: Engine | Connection) -> Iterator[list[str]]:
+    """Record the SQL of every statement executed on ``target``.
+
+    Args:
+        target: Sync engine or connection to listen on.
+
+    Yields:
+        List that collects each statement's SQL text while the block runs.
+    """
+    statements: list[str] = []
+
+    def _record(_conn: Connection, _cursor: object, statement: str, *_args: object) -> None:
+        statements.append(statement)
+
+    sa_event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(target, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def capture_statements() -> StatementCapture:
+    """Provide a context manager that captures executed SQL statements.
+
+    Returns:
+        Callable taking a sync engine or connection and returning a
+        context manager that yields the captured statement list.
+    """
+    return _capture_statements
+
+
+@pytest_asyncio.fixture(scope="session")
+async def sqlite_engine() -> AsyncIterator[AsyncEngine]:
+    """Create one in-memory SQLite engine with the full schema.
+
+    StaticPool keeps the single in-memory connection alive for the
+    whole session so every test sees the same database.
+
+    Yields:
+        AsyncEngine backed by aiosqlite.
+    """
+    engine = create_async_engine(
+        SQLITE_MEMORY_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def sqlite_session(sqlite_engine: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    """Provide a real ORM session whose writes roll back after the test.
+
+    Yields:
+        AsyncSession bound to the shared in-memory engine.
+    """
+    async with sqlite_engine.connect() as conn:
+        transaction = await conn.begin()
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def asgi_client() -> AsyncIterator[AsyncClient]:
+    """Share one ASGI client across route tests for the whole session.
+
+    Webhook handlers resolve their dependencies at call time, so tests
+    that patch those dependencies can still reuse this client.
+
+    Yields:
+        AsyncClient bound to a session-wide FastAPI app.
+    """
+    transport = ASGITransport(app=create_app())
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
@@ -0,0 +1,51 @@
+"""Shared fixtures for database tests that need a live Postgres."""
+
+import socket
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from src.config.settings import get_settings
+
+DEFAULT_POSTGRES_PORT = 5432
+PROBE_TIMEOUT_SECONDS = 0.5
+
+_database_reachable: bool | None = None
+
+
+def _probe_database() -> bool:
+    """Check that the configured Postgres accepts TCP connections.
+
+    Returns:
+        True if a socket could be opened to the database host.
+    """
+    url = make_url(get_settings().database_url)
+    if url.host is None:
+        return False
+    try:
+        with socket.create_connection(
+            (url.host, url.port or DEFAULT_POSTGRES_PORT),
+            timeout=PROBE_TIMEOUT_SECONDS,
+        ):
+            return True
+    except OSError:
+        return False
+
+
+def is_database_reachable() -> bool:
+    """Return the cached result of a single reachability probe.
+
+    Returns:
+        True if the configured Postgres was reachable on first check.
+    """
+    global _database_reachable
+    if _database_reachable is None:
+        _database_reachable = _probe_database()
+    return _database_reachable
+
+
+@pytest.fixture(scope="session")
+def require_database() -> None:
+    """Skip dependent tests when Cloud SQL is not reachable."""
+    if not is_database_reachable():
+        pytest.skip("cloud_sql unreachable")
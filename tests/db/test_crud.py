@@ -1,13 +1,20 @@
 """Integration tests for database CRUD operations against Cloud SQL."""
 
+from __future__ import annotations
+
 import uuid
 from datetime import UTC, date, datetime
+from typing import TYPE_CHECKING
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
 
+from src.agents.identity import mark_wrong_person, verify_identity
+from src.agents.outreach import handle_stop_keyword
 from src.config.settings import get_settings
-from src.db.events import log_event
+from src.db.events import log_event, log_events
 from src.db.postgres import (
     create_appointment,
     create_conversation,
@@ -20,44 +27,73 @@ from src.db.postgres import (
 )
 from src.shared.identity import generate_mary_id
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from src.db.models import Participant
+    from tests.conftest import StatementCapture
+
 PEPPER = "test-pepper-for-crud-tests"
 
+EVENT_KEY_ID = uuid.UUID(int=1)
 
-@pytest.fixture
-async def db_session():
-    """Create a test session that rolls back after each test.
+
+@pytest_asyncio.fixture(scope="class")
+async def db_connection(require_database: None) -> AsyncIterator[AsyncConnection]:
+    """Open one connection per test class inside an outer transaction.
+
+    Everything written during the class is rolled back at teardown.
+    Skipped when the database is unreachable.
 
     Yields:
-        AsyncSession scoped to test, auto-rollback.
+        AsyncConnection with an open outer transaction.
     """
     settings = get_settings()
-    engine = create_async_engine(settings.database_url)
-    async with engine.begin() as conn:
-        session_factory = async_sessionmaker(
-            bind=conn, class_=AsyncSession, expire_on_commit=False
-        )
-        async with session_factory() as session:
-            yield session
-            await session.rollback()
+    engine = create_async_engine(settings.database_url, poolclass=NullPool)
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
     await engine.dispose()
 
 
 @pytest.fixture
-async def sample_participant(db_session: AsyncSession):
-    """Create and return a sample participant.
+async def db_session(db_connection: AsyncConnection) -> AsyncIterator[AsyncSession]:
+    """Create a test session wrapped in a SAVEPOINT.
+
+    Each test's writes roll back to the savepoint, leaving class-scoped
+    rows such as ``shared_participant`` in place.
+
+    Yields:
+        AsyncSession scoped to test, auto-rollback.
+    """
+    async with AsyncSession(
+        bind=db_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    ) as session:
+        yield session
+
 
-    Returns:
+@pytest_asyncio.fixture(scope="class")
+async def shared_participant(db_connection: AsyncConnection) -> AsyncIterator[Participant]:
+    """Create one sample participant shared by every test in a class.
+
+    Yields:
         Participant record for testing.
     """
-    return await create_participant(
-        db_session,
-        first_name="Jane",
-        last_name="Tester",
-        date_of_birth=date(1985, 3, 15),
-        phone="+1-555-000-1234",
-        pepper=PEPPER,
-        language="en",
-    )
+    async with AsyncSession(bind=db_connection, expire_on_commit=False) as session:
+        yield await create_participant(
+            session,
+            first_name="Jane",
+            last_name="Tester",
+            date_of_birth=date(1985, 3, 15),
+            phone="+1-555-000-1234",
+            pepper=PEPPER,
+            language="en",
+        )
 
 
 class TestCreateParticipant:
@@ -105,6 +141,26 @@ class TestCreateParticipant:
         assert found is not None
         assert found.first_name == "Bob"
 
+    async def test_repeat_lookup_by_id_skips_query(
+        self,
+        db_session: AsyncSession,
+        db_connection: AsyncConnection,
+        capture_statements: StatementCapture,
+    ) -> None:
+        """A participant already in the session is served from its identity map."""
+        p = await create_participant(
+            db_session,
+            first_name="Cara",
+            last_name="Lee",
+            date_of_birth=date(1970, 2, 2),
+            phone="5552222222",
+            pepper=PEPPER,
+        )
+        with capture_statements(db_connection.sync_connection) as statements:
+            found = await get_participant_by_id(db_session, p.participant_id)
+        assert found is p
+        assert statements == []
+
     async def test_not_found_returns_none(self, db_session: AsyncSession) -> None:
         """Missing participant returns None."""
         found = await get_participant_by_mary_id(db_session, "nonexistent")
@@ -114,11 +170,11 @@ class TestCreateParticipant:
 class TestEnrollInTrial:
     """Trial enrollment creates participant_trials record."""
 
-    async def test_enroll(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_enroll(self, db_session: AsyncSession, shared_participant) -> None:
         """Participant can be enrolled in a trial."""
         pt = await enroll_in_trial(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             trial_id="TRIAL-001",
         )
         assert pt.trial_id == "TRIAL-001"
@@ -127,14 +183,70 @@ class TestEnrollInTrial:
         assert pt.eligibility_status == "pending"
 
 
+class TestJsonbFlagUpdates:
+    """DNC and identity-attempt changes on an existing JSONB value reach the database."""
+
+    async def test_stop_keeps_earlier_channels(self, db_session: AsyncSession) -> None:
+        """A second STOP adds its channel without losing the first."""
+        p = await create_participant(
+            db_session,
+            first_name="Dee",
+            last_name="Stop",
+            date_of_birth=date(1982, 4, 4),
+            phone="5553334444",
+            pepper=PEPPER,
+        )
+        p.dnc_flags = {"voice": True}
+        await db_session.flush()
+
+        await handle_stop_keyword(db_session, p.participant_id, "sms")
+        await db_session.flush()
+        await db_session.refresh(p)
+        assert p.dnc_flags == {"voice": True, "sms": True}
+
+    async def test_wrong_person_sets_all_channels(self, db_session: AsyncSession) -> None:
+        """Marking a wrong person persists all_channels alongside existing flags."""
+        p = await create_participant(
+            db_session,
+            first_name="Eli",
+            last_name="Wrong",
+            date_of_birth=date(1983, 5, 5),
+            phone="5554445555",
+            pepper=PEPPER,
+        )
+        p.dnc_flags = {"voice": True}
+        await db_session.flush()
+
+        await mark_wrong_person(db_session, p.participant_id)
+        await db_session.flush()
+        await db_session.refresh(p)
+        assert p.dnc_flags == {"voice": True, "all_channels": True}
+
+    async def test_identity_attempts_accumulate(self, db_session: AsyncSession) -> None:
+        """Each failed identity check persists its attempt count."""
+        p = await create_participant(
+            db_session,
+            first_name="Fay",
+            last_name="Count",
+            date_of_birth=date(1984, 6, 6),
+            phone="5555556666",
+            pepper=PEPPER,
+        )
+        for _ in range(3):
+            await verify_identity(db_session, p.participant_id, 1900, "00000")
+            await db_session.flush()
+        await db_session.refresh(p)
+        assert p.contactability == {"identity_attempts": 3}
+
+
 class TestEventLogging:
     """Append-only event logging with idempotency."""
 
-    async def test_log_event(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_log_event(self, db_session: AsyncSession, shared_participant) -> None:
         """Event is created with correct fields."""
         event = await log_event(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             event_type="consent_captured",
             provenance="patient_stated",
             channel="voice",
@@ -144,19 +256,19 @@ class TestEventLogging:
         assert event.event_type == "consent_captured"
 
     async def test_idempotency_prevents_duplicate(
-        self, db_session: AsyncSession, sample_participant
+        self, db_session: AsyncSession, shared_participant
     ) -> None:
         """Duplicate idempotency key is silently skipped."""
-        key = f"test-{uuid.uuid4()}"
+        key = f"test-{EVENT_KEY_ID}"
         event1 = await log_event(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             event_type="slot_booked",
             idempotency_key=key,
         )
         event2 = await log_event(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             event_type="slot_booked",
             idempotency_key=key,
         )
@@ -164,33 +276,49 @@ class TestEventLogging:
         assert event2 is None
 
     async def test_different_keys_both_created(
-        self, db_session: AsyncSession, sample_participant
+        self, db_session: AsyncSession, shared_participant
     ) -> None:
-        """Different idempotency keys create separate events."""
-        event1 = await log_event(
+        """Batch insert with different idempotency keys creates every event."""
+        participant_id = shared_participant.participant_id
+        event_ids = await log_events(
             db_session,
-            participant_id=sample_participant.participant_id,
-            event_type="reminder_sent",
-            idempotency_key=f"key-a-{uuid.uuid4()}",
+            [
+                {
+                    "participant_id": participant_id,
+                    "event_type": "reminder_sent",
+                    "idempotency_key": f"key-a-{EVENT_KEY_ID}",
+                },
+                {
+                    "participant_id": participant_id,
+                    "event_type": "reminder_sent",
+                    "idempotency_key": f"key-b-{EVENT_KEY_ID}",
+                },
+            ],
         )
-        event2 = await log_event(
-            db_session,
-            participant_id=sample_participant.participant_id,
-            event_type="reminder_sent",
-            idempotency_key=f"key-b-{uuid.uuid4()}",
-        )
-        assert event1 is not None
-        assert event2 is not None
+        assert len(event_ids) == 2
+
+    async def test_batch_duplicate_key_inserted_once(
+        self, db_session: AsyncSession, shared_participant
+    ) -> None:
+        """Batch insert skips rows whose idempotency key repeats."""
+        key = f"key-dup-{EVENT_KEY_ID}"
+        event = {
+            "participant_id": shared_participant.participant_id,
+            "event_type": "reminder_sent",
+            "idempotency_key": key,
+        }
+        event_ids = await log_events(db_session, [event, dict(event)])
+        assert len(event_ids) == 1
 
 
 class TestAppointment:
     """Appointment creation."""
 
-    async def test_create(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_create(self, db_session: AsyncSession, shared_participant) -> None:
         """Appointment is created with booked status."""
         appt = await create_appointment(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             trial_id="TRIAL-001",
             visit_type="screening",
             scheduled_at=datetime(2026, 3, 1, 10, 0, tzinfo=UTC),
@@ -203,11 +331,11 @@ class TestAppointment:
 class TestHandoff:
     """Handoff queue creation."""
 
-    async def test_create(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_create(self, db_session: AsyncSession, shared_participant) -> None:
         """Handoff ticket is created with open status."""
         handoff = await create_handoff(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             reason="medical_advice",
             severity="HANDOFF_NOW",
             summary="Participant asked about medication interactions",
@@ -219,11 +347,11 @@ class TestHandoff:
 class TestRide:
     """Transport ride creation."""
 
-    async def test_create(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_create(self, db_session: AsyncSession, shared_participant) -> None:
         """Ride is created with pending status."""
         appt = await create_appointment(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             trial_id="TRIAL-001",
             visit_type="screening",
             scheduled_at=datetime(2026, 3, 1, 10, 0, tzinfo=UTC),
@@ -231,7 +359,7 @@ class TestRide:
         ride = await create_ride(
             db_session,
             appointment_id=appt.appointment_id,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             pickup_address="123 Main St, San Francisco, CA 94107",
             dropoff_address="456 Research Way, Palo Alto, CA 94304",
             scheduled_pickup_at=datetime(2026, 3, 1, 9, 0, tzinfo=UTC),
@@ -243,11 +371,11 @@ class TestRide:
 class TestConversation:
     """Conversation record creation."""
 
-    async def test_create(self, db_session: AsyncSession, sample_participant) -> None:
+    async def test_create(self, db_session: AsyncSession, shared_participant) -> None:
         """Conversation is created with active status."""
         convo = await create_conversation(
             db_session,
-            participant_id=sample_participant.participant_id,
+            participant_id=shared_participant.participant_id,
             channel="voice",
             direction="outbound",
             agent_name="outreach",
@@ -24,77 +24,82 @@ EXPECTED_TABLES = {
     "trials",
 }
 
+_TABLES = Base.metadata.tables
+_EVENT_INDEX_NAMES = {idx.name for idx in _TABLES["events"].indexes}
+_PARTICIPANT_INDEX_NAMES = {idx.name for idx in _TABLES["participants"].indexes}
+_PARTICIPANT_TRIAL_CONSTRAINT_NAMES = {
+    c.name for c in _TABLES["participant_trials"].constraints if c.name
+}
+
 
 def test_all_tables_defined() -> None:
     """All 9 operational tables are defined in metadata."""
-    table_names = set(Base.metadata.tables.keys())
-    assert table_names == EXPECTED_TABLES
+    assert _TABLES.keys() == EXPECTED_TABLES
 
 
 def test_participant_table_name() -> None:
     """Participant model maps to correct table."""
-    assert Participant.__tablename__ == "participants"
+    assert _TABLES["participants"] is Participant.__table__
 
 
 def test_participant_trial_table_name() -> None:
     """ParticipantTrial model maps to correct table."""
-    assert ParticipantTrial.__tablename__ == "participant_trials"
+    assert _TABLES["participant_trials"] is ParticipantTrial.__table__
 
 
 def test_appointment_table_name() -> None:
     """Appointment model maps to correct table."""
-    assert Appointment.__tablename__ == "appointments"
+    assert _TABLES["appointments"] is Appointment.__table__
 
 
 def test_conversation_table_name() -> None:
     """Conversation model maps to correct table."""
-    assert Conversation.__tablename__ == "conversations"
+    assert _TABLES["conversations"] is Conversation.__table__
 
 
 def test_event_table_name() -> None:
     """Event model maps to correct table."""
-    assert Event.__tablename__ == "events"
+    assert _TABLES["events"] is Event.__table__
 
 
 def test_handoff_queue_table_name() -> None:
     """HandoffQueue model maps to correct table."""
-    assert HandoffQueue.__tablename__ == "handoff_queue"
+    assert _TABLES["handoff_queue"] is HandoffQueue.__table__
 
 
 def test_ride_table_name() -> None:
     """Ride model maps to correct table."""
-    assert Ride.__tablename__ == "rides"
+    assert _TABLES["rides"] is Ride.__table__
 
 
 def test_agent_reasoning_table_name() -> None:
     """AgentReasoning model maps to correct table."""
-    assert AgentReasoning.__tablename__ == "agent_reasoning"
+    assert _TABLES["agent_reasoning"] is AgentReasoning.__table__
 
 
 def test_mary_id_is_unique() -> None:
     """mary_id column has unique constraint."""
-    col = Participant.__table__.c.mary_id
-    assert col.unique is True
+    assert _TABLES["participants"].c.mary_id.unique is True
 
 
 def test_idempotency_key_is_unique() -> None:
     """Event idempotency_key has unique constraint."""
-    col = Event.__table__.c.idempotency_key
-    assert col.unique is True
+    assert _TABLES["events"].c.idempotency_key.unique is True
 
 
 def test_participant_trial_unique_constraint() -> None:
     """Each participant-trial pair is unique."""
-    constraints = [
-        c.name for c in ParticipantTrial.__table__.constraints if hasattr(c, "name") and c.name
-    ]
-    assert "uq_participant_trial" in constraints
+    assert "uq_participant_trial" in _PARTICIPANT_TRIAL_CONSTRAINT_NAMES
 
 
 def test_events_composite_index() -> None:
     """Events table has the participant+type+created composite index."""
-    index_names = [idx.name for idx in Event.__table__.indexes]
-    assert "ix_events_participant_type_created" in index_names
+    assert "ix_events_participant_type_created" in _EVENT_INDEX_NAMES
+
+
+def test_participants_duplicate_lookup_index() -> None:
+    """Participants table has the phone+DOB+ZIP index used by duplicate detection."""
+    assert "ix_participants_phone_dob_zip" in _PARTICIPANT_INDEX_NAMES
 
 
 def test_conversation_audio_field_name() -> None:
@@ -1,20 +1,33 @@
 """Tests for the async database session dependency."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.db import session as session_module
 from src.db.session import get_session
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from tests.conftest import FakeSession
+
 
 class TestGetSession:
     """Session dependency yields and commits."""
 
-    async def test_commits_on_success(self) -> None:
+    async def test_commits_on_success(self, fake_session: FakeSession) -> None:
         """Session is committed after successful use."""
-        mock_session = AsyncMock()
-
         mock_factory = MagicMock()
         mock_ctx = AsyncMock()
-        mock_ctx.__aenter__.return_value = mock_session
+        mock_ctx.__aenter__.return_value = fake_session
         mock_ctx.__aexit__.return_value = False
         mock_factory.return_value = mock_ctx
 
@@ -24,10 +37,58 @@ class TestGetSession:
         ):
             gen = get_session()
             session = await gen.__anext__()
-            assert session is mock_session
+            assert session is fake_session.as_session
             import contextlib
 
             with contextlib.suppress(StopAsyncIteration):
                 await gen.__anext__()
 
-        mock_session.commit.assert_awaited_once()
+        assert fake_session.commit_count == 1
+
+
+class TestGetEngine:
+    """Production engine uses an asyncio-safe connection pool."""
+
+    @pytest.fixture
+    async def engine(self, monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[AsyncEngine]:
+        """Build a fresh production engine without touching the cached one.
+
+        Yields:
+            AsyncEngine from _get_engine(); no connection is opened.
+        """
+        monkeypatch.setattr(session_module, "_engine", None)
+        engine = session_module._get_engine()
+        yield engine
+        await engine.dispose()
+
+    @pytest.fixture
+    def engine_kwargs(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+        """Capture the keyword arguments _get_engine() passes to create_async_engine.
+
+        Returns:
+            Keyword arguments of the single create_async_engine call.
+        """
+        monkeypatch.setattr(session_module, "_engine", None)
+        create_engine = MagicMock()
+        monkeypatch.setattr(session_module, "create_async_engine", create_engine)
+        session_module._get_engine()
+        return dict(create_engine.call_args.kwargs)
+
+    def test_uses_async_adapted_queue_pool(self, engine: AsyncEngine) -> None:
+        """Engine pool is the asyncio-adapted queue pool, not the sync one."""
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+
+    def test_jsonb_codec_uses_orjson(self, engine_kwargs: dict[str, Any]) -> None:
+        """The engine encodes and decodes JSONB columns with orjson."""
+        assert engine_kwargs["json_serializer"] is session_module._json_dumps
+        assert engine_kwargs["json_deserializer"] is orjson.loads
+
+    def test_json_dumps_round_trips_non_str_keys(self) -> None:
+        """JSONB text decodes back to the payload, with int keys stringified."""
+        payload = {"pregnant_or_nursing": {"answer": "no"}, 3: "attempts"}
+        decoded = orjson.loads(session_module._json_dumps(payload))
+        assert decoded == {"pregnant_or_nursing": {"answer": "no"}, "3": "attempts"}
+
+    def test_pool_capacity(self, engine_kwargs: dict[str, Any]) -> None:
+        """Pool allows at least 15 concurrent connections including overflow."""
+        assert engine_kwargs["pool_size"] + engine_kwargs["max_overflow"] >= 15
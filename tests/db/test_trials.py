@@ -1,8 +1,8 @@
 """Tests for the Trial model and TrialRepository CRUD operations."""
 
-from unittest.mock import AsyncMock, MagicMock
+from __future__ import annotations
 
-import pytest
+from typing import TYPE_CHECKING
 
 from src.db.models import Trial
 from src.db.trials import (
@@ -13,14 +13,10 @@ from src.db.trials import (
     seed_diabetes_study_a,
 )
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-@pytest.fixture
-def mock_session() -> AsyncMock:
-    """Provide a mock async database session."""
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
-    return session
+    from tests.conftest import FakeSession, StatementCapture
 
 
 class TestTrialModel:
@@ -42,10 +38,10 @@ class TestTrialModel:
 class TestCreateTrial:
     """create_trial persists a Trial record."""
 
-    async def test_creates_trial_record(self, mock_session: AsyncMock) -> None:
-        """create_trial returns a Trial with correct fields."""
+    async def test_creates_trial_record(self, sqlite_session: AsyncSession) -> None:
+        """create_trial persists a Trial with correct fields."""
         trial = await create_trial(
-            mock_session,
+            sqlite_session,
             trial_name="Diabetes Study A",
             pi_name="Dr. Smith",
             coordinator_name="Jane Doe",
@@ -58,67 +54,90 @@ class TestCreateTrial:
         assert trial.trial_name == "Diabetes Study A"
         assert trial.pi_name == "Dr. Smith"
         assert trial.active is True
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_awaited_once()
+        assert await sqlite_session.get(Trial, trial.trial_id) is trial
+
+    async def test_adds_and_flushes(self, fake_session: FakeSession) -> None:
+        """create_trial stages the record and flushes without committing."""
+        trial = await create_trial(fake_session.as_session, trial_name="Contract Trial")
+        fake_session.add.assert_called_once_with(trial)
+        assert fake_session.flush_count == 1
+        assert fake_session.commit_count == 0
 
 
 class TestGetTrial:
     """get_trial retrieves by ID."""
 
-    async def test_returns_trial_when_found(self, mock_session: AsyncMock) -> None:
+    async def test_returns_trial_when_found(self, sqlite_session: AsyncSession) -> None:
         """get_trial returns the Trial if it exists."""
         trial_id = "test-trial-1"
-        fake_trial = Trial(trial_id=trial_id, trial_name="Test Trial")
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = fake_trial
-        mock_session.execute.return_value = result_mock
+        sqlite_session.add(Trial(trial_id=trial_id, trial_name="Test Trial"))
+        await sqlite_session.flush()
 
-        result = await get_trial(mock_session, trial_id)
+        result = await get_trial(sqlite_session, trial_id)
         assert result is not None
         assert result.trial_name == "Test Trial"
 
-    async def test_returns_none_when_not_found(self, mock_session: AsyncMock) -> None:
+    async def test_returns_none_when_not_found(self, sqlite_session: AsyncSession) -> None:
         """get_trial returns None for missing trial."""
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = result_mock
-
-        result = await get_trial(mock_session, "nonexistent-trial")
+        result = await get_trial(sqlite_session, "nonexistent-trial")
         assert result is None
 
 
 class TestGetTrialCriteria:
     """get_trial_criteria returns inclusion + exclusion criteria."""
 
-    async def test_returns_criteria_dict(self, mock_session: AsyncMock) -> None:
+    async def test_returns_criteria_dict(self, sqlite_session: AsyncSession) -> None:
         """Returns both inclusion and exclusion criteria."""
         trial_id = "test-trial-1"
-        fake_trial = Trial(
-            trial_id=trial_id,
-            trial_name="Test",
-            inclusion_criteria={"min_age": 18},
-            exclusion_criteria={"pregnant": True},
+        sqlite_session.add(
+            Trial(
+                trial_id=trial_id,
+                trial_name="Test",
+                inclusion_criteria={"min_age": 18},
+                exclusion_criteria={"pregnant": True},
+            )
         )
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = fake_trial
-        mock_session.execute.return_value = result_mock
+        await sqlite_session.flush()
 
-        criteria = await get_trial_criteria(mock_session, trial_id)
+        criteria = await get_trial_criteria(sqlite_session, trial_id)
         assert criteria["inclusion"]["min_age"] == 18
         assert criteria["exclusion"]["pregnant"] is True
 
+    async def test_repeat_calls_share_one_select(
+        self,
+        sqlite_session: AsyncSession,
+        sqlite_engine: AsyncEngine,
+        capture_statements: StatementCapture,
+    ) -> None:
+        """Criteria for a trial already loaded in the session cost no query."""
+        trial_id = "test-trial-cached"
+        sqlite_session.add(Trial(trial_id=trial_id, trial_name="Cached"))
+        await sqlite_session.flush()
+        sqlite_session.expunge_all()
+        # The identity map holds weak references; keep the trial alive as a
+        # caller such as get_screening_criteria does.
+        trial = await get_trial(sqlite_session, trial_id)
+        with capture_statements(sqlite_engine.sync_engine) as statements:
+            for _ in range(100):
+                await get_trial_criteria(sqlite_session, trial_id)
+        assert trial is not None
+        assert statements == []
+
 
 class TestListActiveTrials:
     """list_active_trials returns only active trials."""
 
-    async def test_returns_active_only(self, mock_session: AsyncMock) -> None:
+    async def test_returns_active_only(self, sqlite_session: AsyncSession) -> None:
         """Only active trials are returned."""
-        active = Trial(trial_id="active-trial", trial_name="Active", active=True)
-        result_mock = MagicMock()
-        result_mock.scalars.return_value.all.return_value = [active]
-        mock_session.execute.return_value = result_mock
+        sqlite_session.add_all(
+            [
+                Trial(trial_id="active-trial", trial_name="Active", active=True),
+                Trial(trial_id="closed-trial", trial_name="Closed", active=False),
+            ]
+        )
+        await sqlite_session.flush()
 
-        trials = await list_active_trials(mock_session)
+        trials = await list_active_trials(sqlite_session)
         assert len(trials) == 1
         assert trials[0].trial_name == "Active"
 
@@ -126,11 +145,11 @@ class TestListActiveTrials:
 class TestSeedDiabetesStudyA:
     """seed_diabetes_study_a creates the demo trial."""
 
-    async def test_seed_creates_trial(self, mock_session: AsyncMock) -> None:
+    async def test_seed_creates_trial(self, sqlite_session: AsyncSession) -> None:
         """Seed creates a trial with Diabetes Study A data."""
-        trial = await seed_diabetes_study_a(mock_session)
+        trial = await seed_diabetes_study_a(sqlite_session)
         assert trial.trial_name == "Diabetes Study A"
         assert trial.pi_name is not None
         assert trial.inclusion_criteria is not None
         assert trial.exclusion_criteria is not None
-        mock_session.add.assert_called_once()
+        assert await sqlite_session.get(Trial, "diabetes-study-a") is trial
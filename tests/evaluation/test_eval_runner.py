@@ -1,7 +1,10 @@
 """Tests for the evaluation framework runner."""
 
 import dataclasses
+import sys
+import types
 from datetime import date
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -17,6 +20,28 @@ from eval.run_eval import (
 )
 
 
+def register_fake_module(
+    monkeypatch: pytest.MonkeyPatch, name: str, **attrs: object
+) -> types.ModuleType:
+    """Install a throwaway module in sys.modules for the current test.
+
+    monkeypatch restores sys.modules at teardown, even if the test fails.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        name: Importable module name.
+        **attrs: Attributes to set on the module.
+
+    Returns:
+        The registered module.
+    """
+    module = types.ModuleType(name)
+    for attr_name, value in attrs.items():
+        setattr(module, attr_name, value)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
 class TestLoadScenario:
     """Scenario YAML loading."""
 
@@ -38,6 +63,14 @@ class TestLoadScenario:
         assert "trial_id" in scenario
         assert isinstance(scenario["trial_id"], str)
 
+    def test_repeated_loads_are_cached(self) -> None:
+        """Second load of the same scenario is served from the cache."""
+        load_scenario.cache_clear()
+        first = load_scenario("happy_path")
+        second = load_scenario("happy_path")
+        assert second is first
+        assert load_scenario.cache_info().hits > 0
+
 
 class TestBuildMockParticipant:
     """Mock participant construction."""
@@ -78,30 +111,34 @@ class TestBuildMockTrial:
         assert trial.max_distance_km == 100.0
 
 
+IDENTITY_STEP = {"action": "verify_identity", "module": "src.agents.identity"}
+
+
+@pytest.fixture(scope="module")
+def one_step_patches() -> list[Any]:
+    """Build patches for a single identity step once per module.
+
+    Returns:
+        Patch context managers for the identity module's DB helpers.
+    """
+    return _build_db_patches([IDENTITY_STEP], MagicMock(), MagicMock())
+
+
 class TestBuildDbPatches:
     """DB function patching."""
 
-    def test_patches_known_db_functions(self) -> None:
+    def test_patches_known_db_functions(self, one_step_patches: list[Any]) -> None:
         """Creates patches for DB functions found in step modules."""
-        steps = [
-            {"action": "verify_identity", "module": "src.agents.identity"},
-        ]
-        participant = MagicMock()
-        trial = MagicMock()
-        patches = _build_db_patches(steps, participant, trial)
-        assert len(patches) > 0
+        assert len(one_step_patches) > 0
 
-    def test_skips_duplicate_modules(self) -> None:
+    def test_skips_duplicate_modules(self, one_step_patches: list[Any]) -> None:
         """Only patches each module once."""
         steps = [
-            {"action": "verify_identity", "module": "src.agents.identity"},
+            IDENTITY_STEP,
             {"action": "mark_wrong_person", "module": "src.agents.identity"},
         ]
-        participant = MagicMock()
-        trial = MagicMock()
-        patches_once = _build_db_patches(steps[:1], participant, trial)
-        patches_twice = _build_db_patches(steps, participant, trial)
-        assert len(patches_once) == len(patches_twice)
+        patches_twice = _build_db_patches(steps, MagicMock(), MagicMock())
+        assert len(patches_twice) == len(one_step_patches)
 
 
 class TestApplyStepMockData:
@@ -136,7 +173,6 @@ class TestApplyStepMockData:
 class TestExecuteStep:
     """Step execution."""
 
-    @pytest.mark.asyncio
     async def test_placeholder_skipped(self) -> None:
         """Placeholder steps return passed + skipped."""
         step = {
@@ -149,8 +185,7 @@ class TestExecuteStep:
         assert result["passed"] is True
         assert result["skipped"] is True
 
-    @pytest.mark.asyncio
-    async def test_handles_dataclass_result(self) -> None:
+    async def test_handles_dataclass_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Converts dataclass results to dict for comparison."""
 
         @dataclasses.dataclass
@@ -161,79 +196,64 @@ class TestExecuteStep:
         async def fake_func(response: str) -> FakeResult:
             return FakeResult()
 
-        import types
+        register_fake_module(monkeypatch, "fake_mod", fake_action=fake_func)
+        step = {
+            "action": "fake_action",
+            "module": "fake_mod",
+            "params": {"response": "test"},
+            "expect": {"triggered": True, "severity": "HANDOFF_NOW"},
+        }
+        result = await execute_step(step, AsyncMock())
+        assert result["passed"] is True
+        assert result["actual"]["triggered"] is True
 
-        fake_mod = types.ModuleType("fake_mod")
-        fake_mod.fake_action = fake_func
 
-        import sys
+PASSED_STEP = {"passed": True}
+FAILED_STEP = {"passed": False}
 
-        sys.modules["fake_mod"] = fake_mod
-        try:
-            step = {
-                "action": "fake_action",
-                "module": "fake_mod",
-                "params": {"response": "test"},
-                "expect": {"triggered": True, "severity": "HANDOFF_NOW"},
-            }
-            result = await execute_step(step, AsyncMock())
-            assert result["passed"] is True
-            assert result["actual"]["triggered"] is True
-        finally:
-            del sys.modules["fake_mod"]
+
+def _scenario_result(steps: list[dict[str, Any]], total_steps: int) -> dict[str, Any]:
+    """Build a run_scenario-shaped result for metric tests."""
+    return {
+        "scenario": "test",
+        "passed": all(step["passed"] for step in steps) and bool(steps),
+        "total_steps": total_steps,
+        "steps": steps,
+    }
 
 
 class TestMetrics:
     """Scoring and aggregation."""
 
-    def test_score_all_passed(self) -> None:
-        """Score is 1.0 when all steps pass."""
-        result = {
-            "scenario": "test",
-            "passed": True,
-            "total_steps": 2,
-            "steps": [{"passed": True}, {"passed": True}],
-        }
-        assert score_scenario(result) == 1.0
-
-    def test_score_partial_pass(self) -> None:
-        """Score reflects partial pass rate."""
-        result = {
-            "scenario": "test",
-            "passed": False,
-            "total_steps": 4,
-            "steps": [
-                {"passed": True},
-                {"passed": False},
-                {"passed": True},
-                {"passed": False},
-            ],
-        }
-        assert score_scenario(result) == 0.5
-
-    def test_score_empty_steps(self) -> None:
-        """Score is 0.0 when there are no steps."""
-        result = {
-            "scenario": "test",
-            "passed": False,
-            "total_steps": 0,
-            "steps": [],
-        }
-        assert score_scenario(result) == 0.0
-
-    def test_check_failures_extracts_errors(self) -> None:
-        """Failure descriptions extracted from failed steps."""
-        result = {
-            "steps": [
-                {"passed": True},
-                {"passed": False, "error": "timeout"},
-                {"passed": False},
-            ],
-        }
-        failures = check_failures(result)
-        assert len(failures) == 2
-        assert "Step 1: timeout" in failures
-        assert "Step 2: assertion mismatch" in failures
+    @pytest.mark.parametrize(
+        ("steps", "total_steps", "expected"),
+        [
+            ([PASSED_STEP, PASSED_STEP], 2, 1.0),
+            ([PASSED_STEP, FAILED_STEP, PASSED_STEP, FAILED_STEP], 4, 0.5),
+            ([], 0, 0.0),
+        ],
+        ids=["all_passed", "partial_pass", "empty_steps"],
+    )
+    def test_score_scenario(
+        self, steps: list[dict[str, Any]], total_steps: int, expected: float
+    ) -> None:
+        """Score is the fraction of passed steps, 0.0 when there are none."""
+        assert score_scenario(_scenario_result(steps, total_steps)) == expected
+
+    @pytest.mark.parametrize(
+        ("steps", "expected"),
+        [
+            (
+                [PASSED_STEP, {"passed": False, "error": "timeout"}, FAILED_STEP],
+                ["Step 1: timeout", "Step 2: assertion mismatch"],
+            ),
+            ([PASSED_STEP, PASSED_STEP], []),
+        ],
+        ids=["errors_and_mismatches", "no_failures"],
+    )
+    def test_check_failures(self, steps: list[dict[str, Any]], expected: list[str]) -> None:
+        """Failure descriptions are extracted from failed steps only."""
+        assert check_failures({"steps": steps}) == expected
 
     def test_aggregate_multiple_scenarios(self) -> None:
         """Aggregation counts pass/fail correctly."""
@@ -1,36 +1,39 @@
 """Integration tests for Cloud Tasks scheduling."""
 
+import asyncio
 import uuid
 from datetime import UTC, datetime, timedelta
 
 from src.services.cloud_tasks_client import enqueue_reminder
 
+REMINDER_CASES = [
+    ("confirmation_check", "sms", 11, "test-key-123"),
+    ("reminder_24h", "voice", 24, "test-key-456"),
+]
+BASE_TIME = datetime(2026, 3, 14, 9, 0, tzinfo=UTC)
+
 
 class TestCloudTasksScheduling:
     """Cloud Tasks job enqueuing."""
 
-    async def test_enqueue_reminder_returns_task_id(self) -> None:
-        """Enqueued reminder returns a task ID starting with 'task-'."""
-        result = await enqueue_reminder(
-            participant_id=uuid.uuid4(),
-            appointment_id=uuid.uuid4(),
-            template_id="confirmation_check",
-            channel="sms",
-            send_at=datetime.now(UTC) + timedelta(hours=11),
-            idempotency_key="test-key-123",
-        )
-        assert result.task_id.startswith("task-")
-        assert result.scheduled_at
-
-    async def test_task_result_structure(self) -> None:
-        """Task result has expected fields."""
-        result = await enqueue_reminder(
-            participant_id=uuid.uuid4(),
-            appointment_id=uuid.uuid4(),
-            template_id="reminder_24h",
-            channel="voice",
-            send_at=datetime.now(UTC) + timedelta(hours=24),
-            idempotency_key="test-key-456",
+    async def test_enqueues_reminders_concurrently(self) -> None:
+        """Each enqueued reminder returns a 'task-' ID and its schedule time."""
+        send_times = [BASE_TIME + timedelta(hours=hours) for _, _, hours, _ in REMINDER_CASES]
+        results = await asyncio.gather(
+            *(
+                enqueue_reminder(
+                    participant_id=uuid.uuid4(),
+                    appointment_id=uuid.uuid4(),
+                    template_id=template_id,
+                    channel=channel,
+                    send_at=send_at,
+                    idempotency_key=idempotency_key,
+                )
+                for (template_id, channel, _, idempotency_key), send_at in zip(
+                    REMINDER_CASES, send_times, strict=True
+                )
+            )
         )
-        assert hasattr(result, "task_id")
-        assert hasattr(result, "scheduled_at")
+        for result, send_at in zip(results, send_times, strict=True):
+            assert result.task_id.startswith("task-")
+            assert result.scheduled_at == send_at.isoformat()
@@ -1,26 +1,33 @@
 """Integration tests for ElevenLabs client construction."""
 
+import pytest
+
 from src.services.elevenlabs_client import ElevenLabsClient
 
 
+@pytest.fixture(scope="module")
+def client() -> ElevenLabsClient:
+    """Build one ElevenLabs client shared by the module's tests."""
+    return ElevenLabsClient(
+        api_key="test-key",
+        agent_id="test-agent",
+        agent_phone_number_id="test-phone",
+    )
+
+
 class TestElevenLabsConnection:
     """ElevenLabs client setup and configuration."""
 
-    def test_client_construction(self) -> None:
-        """Client constructs with required parameters."""
-        client = ElevenLabsClient(
-            api_key="test-key",
-            agent_id="test-agent",
-            agent_phone_number_id="test-phone",
-        )
-        assert client.api_key == "test-key"
-        assert client.agent_id == "test-agent"
-
-    def test_client_stores_phone_number_id(self) -> None:
-        """Client stores the agent phone number ID."""
-        client = ElevenLabsClient(
-            api_key="test-key",
-            agent_id="test-agent",
-            agent_phone_number_id="test-phone",
-        )
-        assert client.agent_phone_number_id == "test-phone"
+    @pytest.mark.parametrize(
+        ("attribute", "expected"),
+        [
+            ("api_key", "test-key"),
+            ("agent_id", "test-agent"),
+            ("agent_phone_number_id", "test-phone"),
+        ],
+    )
+    def test_client_stores_constructor_argument(
+        self, client: ElevenLabsClient, attribute: str, expected: str
+    ) -> None:
+        """Client keeps each constructor argument as an attribute."""
+        assert getattr(client, attribute) == expected
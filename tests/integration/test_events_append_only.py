@@ -1,55 +1,81 @@
 """Integration tests for append-only event logging."""
 
+from __future__ import annotations
+
 import uuid
-from unittest.mock import AsyncMock, MagicMock
+from typing import TYPE_CHECKING
+
+from src.db.events import log_event, log_events
 
-from src.db.events import log_event
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from tests.conftest import FakeSession
 
 
 class TestEventsAppendOnly:
     """Events are append-only with idempotency enforcement."""
 
-    async def test_log_event_creates_record(self) -> None:
+    async def test_log_event_creates_record(self, sqlite_session: AsyncSession) -> None:
         """Log event creates and flushes a new event."""
-        mock_session = AsyncMock()
-        mock_session.add = MagicMock()
         event = await log_event(
-            mock_session,
+            sqlite_session,
             participant_id=uuid.uuid4(),
             event_type="test_event",
             payload={"test": True},
             provenance="system",
         )
         assert event is not None
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_awaited_once()
+        assert event in sqlite_session
 
-    async def test_idempotency_dedup(self) -> None:
+    async def test_idempotency_dedup(self, sqlite_session: AsyncSession) -> None:
         """Duplicate idempotency key skips event creation."""
-        mock_session = AsyncMock()
-        existing = MagicMock()
-        result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = existing
-        mock_session.execute.return_value = result_mock
-
+        participant_id = uuid.uuid4()
+        first = await log_event(
+            sqlite_session,
+            participant_id=participant_id,
+            event_type="test_event",
+            idempotency_key="dup-key",
+            provenance="system",
+        )
         event = await log_event(
-            mock_session,
-            participant_id=uuid.uuid4(),
+            sqlite_session,
+            participant_id=participant_id,
             event_type="test_event",
             idempotency_key="dup-key",
             provenance="system",
         )
+        assert first is not None
         assert event is None
 
-    async def test_provenance_recorded(self) -> None:
+    async def test_provenance_recorded(self, sqlite_session: AsyncSession) -> None:
         """Event records provenance field."""
-        mock_session = AsyncMock()
-        mock_session.add = MagicMock()
         event = await log_event(
-            mock_session,
+            sqlite_session,
             participant_id=uuid.uuid4(),
             event_type="consent_captured",
             provenance="patient_stated",
         )
         assert event is not None
         assert event.provenance == "patient_stated"
+
+    async def test_log_events_single_round_trip(self, fake_session: FakeSession) -> None:
+        """Batch logging issues one INSERT for all events."""
+        inserted = [uuid.uuid4(), uuid.uuid4()]
+        fake_session.push_result(rows=inserted)
+        participant_id = uuid.uuid4()
+
+        event_ids = await log_events(
+            fake_session.as_session,
+            [
+                {"participant_id": participant_id, "event_type": "a", "idempotency_key": "k1"},
+                {"participant_id": participant_id, "event_type": "b", "idempotency_key": "k2"},
+            ],
+        )
+        assert event_ids == inserted
+        assert fake_session.execute_count == 1
+
+    async def test_log_events_empty_batch_skips_insert(self, fake_session: FakeSession) -> None:
+        """Empty batch returns no IDs without touching the database."""
+        assert await log_events(fake_session.as_session, []) == []
+        assert fake_session.execute_count == 0
@@ -1,9 +1,15 @@
 """Integration tests for Postgres session management."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.db.session import get_session
 
+if TYPE_CHECKING:
+    from tests.conftest import FakeSession
+
 
 class TestPostgresConnection:
     """Database session lifecycle."""
@@ -21,15 +27,14 @@ class TestPostgresConnection:
                 assert session is mock_session
                 break
 
-    async def test_session_commits_on_success(self) -> None:
+    async def test_session_commits_on_success(self, fake_session: FakeSession) -> None:
         """Session commits when no exception occurs."""
-        mock_session = AsyncMock()
         mock_context = AsyncMock()
-        mock_context.__aenter__.return_value = mock_session
+        mock_context.__aenter__.return_value = fake_session
         mock_context.__aexit__.return_value = False
         mock_factory = MagicMock(return_value=mock_context)
 
         with patch("src.db.session._get_session_factory", return_value=mock_factory):
             async for _session in get_session():
                 pass
-            mock_session.commit.assert_awaited_once()
+            assert fake_session.commit_count == 1
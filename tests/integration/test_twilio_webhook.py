@@ -1,33 +1,44 @@
 """Integration tests for Twilio webhook routing."""
 
-from httpx import ASGITransport, AsyncClient
+import pytest
+from httpx import AsyncClient
 
 from src.api.app import create_app
 
 
+@pytest.fixture(scope="module")
+def route_paths() -> frozenset[str]:
+    """Collect the app's registered route paths once per module.
+
+    Reads the OpenAPI schema rather than ``router.routes``, whose entries
+    for included routers carry no ``path`` on newer FastAPI releases.
+
+    Returns:
+        Frozen set of route path templates.
+    """
+    return frozenset(create_app().openapi()["paths"])
+
+
 class TestTwilioWebhook:
     """Twilio webhook endpoint integration."""
 
-    async def test_elevenlabs_server_tool_route_exists(self) -> None:
-        """ElevenLabs server tool webhook endpoint responds."""
-        app = create_app()
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post("/webhooks/elevenlabs/server-tool")
-            assert response.status_code != 404
-
-    async def test_twilio_dtmf_route_exists(self) -> None:
-        """Twilio DTMF capture webhook endpoint responds."""
-        app = create_app()
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post("/webhooks/twilio/dtmf")
-            assert response.status_code != 404
-
-    async def test_twilio_dtmf_verify_route_exists(self) -> None:
-        """Twilio DTMF verify webhook endpoint responds."""
-        app = create_app()
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            response = await client.post("/webhooks/twilio/dtmf-verify")
-            assert response.status_code != 404
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/webhooks/elevenlabs/server-tool",
+            "/webhooks/twilio/dtmf",
+            "/webhooks/twilio/dtmf-verify",
+        ],
+    )
+    def test_webhook_route_registered(self, route_paths: frozenset[str], path: str) -> None:
+        """Webhook path is registered on the app router."""
+        assert path in route_paths
+
+    async def test_server_tool_accepts_payload(self, asgi_client: AsyncClient) -> None:
+        """Server tool webhook handles a real request end to end."""
+        response = await asgi_client.post(
+            "/webhooks/elevenlabs/server-tool",
+            json={"tool_name": "nonexistent_tool", "conversation_id": "conv-1", "parameters": {}},
+        )
+        assert response.status_code == 200
+        assert "unknown_tool" in response.json()["error"]
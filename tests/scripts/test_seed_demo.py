@@ -14,6 +14,16 @@ from scripts.seed_demo import (
     EXTRA_PARTICIPANTS,
 )
 
+REF_DATE = date(2026, 2, 8)
+DEMO_DOB = DEMO_PARTICIPANT["date_of_birth"]
+DEMO_AGE = (REF_DATE - DEMO_DOB).days // 365
+DIABETES_INCLUSION = DIABETES_TRIAL["inclusion_criteria"]
+DIABETES_EXCLUSION = DIABETES_TRIAL["exclusion_criteria"]
+REQUIRED_PARTICIPANT_FIELDS = frozenset(
+    ("first_name", "last_name", "date_of_birth", "phone", "address_zip")
+)
+REQUIRED_INCLUSION_KEYS = frozenset(("min_age", "max_age", "diagnosis"))
+
 
 class TestDemoParticipantData:
     """Demo participant data consistency checks."""
@@ -24,12 +34,11 @@ class TestDemoParticipantData:
 
     def test_dob_is_date_object(self) -> None:
         """DOB is a Python date (not string) for identity agent."""
-        assert isinstance(DEMO_PARTICIPANT["date_of_birth"], date)
+        assert isinstance(DEMO_DOB, date)
 
     def test_dob_year_is_reasonable(self) -> None:
         """DOB year is between 1900 and 2010 for identity verification."""
-        year = DEMO_PARTICIPANT["date_of_birth"].year
-        assert 1900 < year < 2010
+        assert 1900 < DEMO_DOB.year < 2010
 
     def test_has_zip_for_identity_verification(self) -> None:
         """ZIP code present and 5 digits for identity agent."""
@@ -52,10 +61,7 @@ class TestDemoParticipantData:
 
     def test_age_within_inclusion_criteria(self) -> None:
         """Demo participant age falls within inclusion range."""
-        dob = DEMO_PARTICIPANT["date_of_birth"]
-        age = (date(2026, 2, 8) - dob).days // 365
-        criteria = DIABETES_TRIAL["inclusion_criteria"]
-        assert criteria["min_age"] <= age <= criteria["max_age"]
+        assert DIABETES_INCLUSION["min_age"] <= DEMO_AGE <= DIABETES_INCLUSION["max_age"]
 
 
 class TestDiabetesTrialData:
@@ -63,23 +69,19 @@ class TestDiabetesTrialData:
 
     def test_has_inclusion_criteria(self) -> None:
         """Trial has inclusion criteria for screening agent."""
-        criteria = DIABETES_TRIAL["inclusion_criteria"]
-        assert "min_age" in criteria
-        assert "max_age" in criteria
-        assert "diagnosis" in criteria
+        missing = REQUIRED_INCLUSION_KEYS - DIABETES_INCLUSION.keys()
+        assert not missing, f"Missing inclusion criteria {sorted(missing)}"
 
     def test_has_exclusion_criteria(self) -> None:
         """Trial has exclusion criteria for hard-exclude checks."""
-        criteria = DIABETES_TRIAL["exclusion_criteria"]
-        assert len(criteria) > 0
-        assert all(isinstance(v, bool) for v in criteria.values())
+        assert len(DIABETES_EXCLUSION) > 0
+        assert all(isinstance(v, bool) for v in DIABETES_EXCLUSION.values())
 
     def test_has_operating_hours(self) -> None:
         """Trial has operating hours for scheduling agent."""
         hours = DIABETES_TRIAL["operating_hours"]
-        assert "monday" in hours
-        assert "open" in hours["monday"]
-        assert "close" in hours["monday"]
+        missing = {"open", "close"} - hours.get("monday", {}).keys()
+        assert not missing, f"Missing Monday hours {sorted(missing)}"
 
     def test_has_visit_templates(self) -> None:
         """Trial has visit templates for appointment creation."""
@@ -116,19 +118,12 @@ class TestExtraParticipants:
 
     def test_all_have_required_fields(self) -> None:
         """Every extra participant has the fields needed by all agents."""
-        required = [
-            "first_name",
-            "last_name",
-            "date_of_birth",
-            "phone",
-            "address_zip",
-        ]
         for p in EXTRA_PARTICIPANTS:
-            for field in required:
-                assert field in p, f"Missing {field} in {p['first_name']}"
+            missing = REQUIRED_PARTICIPANT_FIELDS - p.keys()
+            assert not missing, f"Missing {sorted(missing)} in {p.get('first_name')}"
 
     def test_unique_phones(self) -> None:
-        """No phone number collisions with demo participant."""
-        demo_phone = DEMO_PARTICIPANT["phone"]
-        for p in EXTRA_PARTICIPANTS:
-            assert p["phone"] != demo_phone
+        """No phone number collisions with the demo participant or each other."""
+        phones = {p["phone"] for p in EXTRA_PARTICIPANTS}
+        assert DEMO_PARTICIPANT["phone"] not in phones
+        assert len(phones) == len(EXTRA_PARTICIPANTS)
@@ -1,13 +1,19 @@
 """Tests for the Cloud Tasks client stub."""
 
+import dataclasses
 import uuid
 from datetime import UTC, datetime
 
+import pytest
+
 from src.services.cloud_tasks_client import (
     TaskEnqueueResult,
     enqueue_reminder,
 )
 
+PARTICIPANT_ID = uuid.UUID(int=1)
+APPOINTMENT_ID = uuid.UUID(int=2)
+
 
 class TestEnqueueReminder:
     """Cloud Tasks enqueue stub."""
@@ -16,8 +22,8 @@ class TestEnqueueReminder:
         """Enqueue returns a task ID and schedule time."""
         send_at = datetime(2026, 3, 14, 10, 0, tzinfo=UTC)
         result = await enqueue_reminder(
-            participant_id=uuid.uuid4(),
-            appointment_id=uuid.uuid4(),
+            participant_id=PARTICIPANT_ID,
+            appointment_id=APPOINTMENT_ID,
             template_id="prep_instructions",
             channel="sms",
             send_at=send_at,
@@ -26,3 +32,10 @@ class TestEnqueueReminder:
         assert isinstance(result, TaskEnqueueResult)
         assert result.task_id.startswith("task-")
         assert result.scheduled_at == send_at.isoformat()
+
+    @pytest.mark.parametrize("field_name", ["task_id", "scheduled_at"])
+    def test_result_is_immutable(self, field_name: str) -> None:
+        """Enqueue results are frozen value objects."""
+        result = TaskEnqueueResult(task_id="task-1", scheduled_at="2026-03-14T10:00:00+00:00")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(result, field_name, "x")
@@ -1,10 +1,14 @@
 """Tests for the ElevenLabs service client."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import dataclasses
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, TypedDict
 
 import pytest
 
 from src.services.elevenlabs_client import (
+    CONVAI_API_URL,
+    CONVAI_CONVERSATION_URL,
     CallResult,
     ElevenLabsClient,
     build_conversation_config_override,
@@ -12,6 +16,199 @@ from src.services.elevenlabs_client import (
     build_system_prompt,
 )
 
+TRIAL_PROMPT_MARKERS = (
+    "INCLUSION CRITERIA",
+    "age: 18-65",
+    "EXCLUSION CRITERIA",
+    "pregnancy: excluded",
+    "VISIT SCHEDULE",
+    "screening: 60 min",
+    "Diabetes Study A",
+    "+15035551234",
+)
+
+# Fixed conversation rules the prompt states regardless of trial criteria.
+PROMPT_RULES = {
+    "one_at_a_time": ("ONE AT A TIME", "NEVER ask multiple questions in a single turn"),
+    "capture_consent": ("capture_consent", "call capture_consent"),
+    "verbal_consent": ("Do NOT assume consent", "WAIT"),
+    "self_determines_eligibility": (
+        "YOU decide eligibility",
+        "Do NOT transfer to determine eligibility",
+    ),
+    "warm_transfer_tiers": (
+        "TIER 1",
+        "MEDICAL EMERGENCY",
+        "TIER 2",
+        "PARTICIPANT IS STUCK",
+        "Would you like me to connect you with a coordinator",
+    ),
+    "complimentary_uber": ("complimentary Uber",),
+    "eligibility_result_format": (
+        "eligible=true",
+        "eligible=false",
+        "Do NOT second-guess the tool result",
+    ),
+}
+
+
+class PromptKwargs(TypedDict):
+    """Keyword arguments for build_system_prompt, unpacked with ``**``."""
+
+    trial_name: str
+    site_name: str
+    coordinator_phone: str
+    inclusion_criteria: dict[str, Any]
+    exclusion_criteria: dict[str, Any]
+    visit_templates: dict[str, Any]
+
+
+# Builder inputs shared across tests; tests must not mutate them.
+TRIAL_PROMPT_KWARGS: PromptKwargs = {
+    "trial_name": "Diabetes Study A",
+    "site_name": "OHSU",
+    "coordinator_phone": "+15035551234",
+    "inclusion_criteria": {"age": "18-65", "diagnosis": "Type 2 Diabetes"},
+    "exclusion_criteria": {"pregnancy": "excluded"},
+    "visit_templates": {"screening": "60 min"},
+}
+EMPTY_PROMPT_KWARGS: PromptKwargs = {
+    "trial_name": "Study",
+    "site_name": "Site",
+    "coordinator_phone": "+10000000000",
+    "inclusion_criteria": {},
+    "exclusion_criteria": {},
+    "visit_templates": {},
+}
+SCREENING_PROMPT_KWARGS: PromptKwargs = {
+    **EMPTY_PROMPT_KWARGS,
+    "inclusion_criteria": {
+        "min_age": 18,
+        "max_age": 75,
+        "diagnosis": "type_2_diabetes",
+        "hba1c_min": 7.0,
+        "hba1c_max": 10.5,
+    },
+    "exclusion_criteria": {
+        "pregnant_or_nursing": True,
+        "insulin_dependent": True,
+    },
+}
+SCREENING_PROMPT_MARKERS = (
+    "SCREENING QUESTIONS",
+    'question_key="age"',
+    'question_key="diagnosis"',
+    'question_key="hba1c"',
+    'question_key="pregnant_or_nursing"',
+    'question_key="insulin_dependent"',
+)
+MINIMAL_VARIABLE_KWARGS = MappingProxyType(
+    {
+        "participant_name": "A",
+        "trial_name": "B",
+        "site_name": "C",
+        "coordinator_phone": "D",
+    }
+)
+
+
+def _response(
+    status_code: int = 200, *, payload: dict | None = None, content: bytes = b""
+) -> SimpleNamespace:
+    """Build an httpx response stand-in with only the attributes the client reads.
+
+    Args:
+        status_code: HTTP status; 4xx/5xx make ``raise_for_status`` raise.
+        payload: Body returned by ``json()``.
+        content: Raw body bytes.
+
+    Returns:
+        SimpleNamespace exposing status_code, json, content and raise_for_status.
+    """
+
+    def raise_for_status() -> None:
+        if status_code >= 400:
+            raise RuntimeError(f"HTTP {status_code}")
+
+    return SimpleNamespace(
+        status_code=status_code,
+        json=lambda: payload,
+        content=content,
+        raise_for_status=raise_for_status,
+    )
+
+
+class FakeHTTPClient:
+    """Async-context-manager stand-in for httpx.AsyncClient.
+
+    Every ``get``/``post`` returns ``response``, which tests set before
+    calling the client under test, and records ``(method, url)`` in
+    ``requests``.
+    """
+
+    def __init__(self) -> None:
+        self.response: SimpleNamespace | None = None
+        self.requests: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "FakeHTTPClient":
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *_exc: object) -> bool:
+        """Exit without suppressing exceptions."""
+        return False
+
+    async def get(self, url: str, **_kwargs: object) -> SimpleNamespace | None:
+        """Record the request and return the preset response."""
+        self.requests.append(("GET", url))
+        return self.response
+
+    async def post(self, url: str, **_kwargs: object) -> SimpleNamespace | None:
+        """Record the request and return the preset response."""
+        self.requests.append(("POST", url))
+        return self.response
+
+
+@pytest.fixture(scope="module")
+def empty_prompt() -> str:
+    """Build the system prompt for EMPTY_PROMPT_KWARGS once per module.
+
+    Returns:
+        Prompt text shared by the tests that only read it.
+    """
+    return build_system_prompt(**EMPTY_PROMPT_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def client() -> ElevenLabsClient:
+    """Provide one ElevenLabsClient with test config per module.
+
+    The client holds only its config; HTTP calls are patched per test.
+
+    Returns:
+        ElevenLabsClient with placeholder credentials.
+    """
+    return ElevenLabsClient(
+        api_key="test-key",
+        agent_id="test-agent-id",
+        agent_phone_number_id="test-phone-id",
+    )
+
+
+@pytest.fixture
+def patched_http(monkeypatch: pytest.MonkeyPatch) -> FakeHTTPClient:
+    """Replace httpx.AsyncClient with a factory for one FakeHTTPClient.
+
+    Returns:
+        FakeHTTPClient returned from ``async with``; set its
+        ``response`` per test.
+    """
+    http = FakeHTTPClient()
+    monkeypatch.setattr(
+        "src.services.elevenlabs_client.httpx.AsyncClient", lambda *_args, **_kwargs: http
+    )
+    return http
+
 
 class TestBuildDynamicVariables:
     """Pure function: build_dynamic_variables."""
@@ -33,24 +230,10 @@ class TestBuildDynamicVariables:
         assert result["participant_id"] == "pid-123"
         assert result["trial_id"] == "trial-abc"
 
-    def test_returns_dict(self) -> None:
-        """Return type is a plain dict."""
-        result = build_dynamic_variables(
-            participant_name="A",
-            trial_name="B",
-            site_name="C",
-            coordinator_phone="D",
-        )
-        assert isinstance(result, dict)
-
     def test_defaults_participant_id_and_trial_id(self) -> None:
-        """participant_id and trial_id default to empty string."""
-        result = build_dynamic_variables(
-            participant_name="A",
-            trial_name="B",
-            site_name="C",
-            coordinator_phone="D",
-        )
+        """Result is a plain dict; participant_id and trial_id default to empty string."""
+        result = build_dynamic_variables(**MINIMAL_VARIABLE_KWARGS)
+        assert isinstance(result, dict)
         assert result["participant_id"] == ""
         assert result["trial_id"] == ""
 
@@ -73,155 +256,26 @@ class TestBuildSystemPrompt:
 
     def test_includes_trial_criteria(self) -> None:
         """System prompt contains inclusion/exclusion criteria."""
-        result = build_system_prompt(
-            trial_name="Diabetes Study A",
-            site_name="OHSU",
-            coordinator_phone="+15035551234",
-            inclusion_criteria={"age": "18-65", "diagnosis": "Type 2 Diabetes"},
-            exclusion_criteria={"pregnancy": "excluded"},
-            visit_templates={"screening": "60 min"},
-        )
-        assert "INCLUSION CRITERIA" in result
-        assert "age: 18-65" in result
-        assert "EXCLUSION CRITERIA" in result
-        assert "pregnancy: excluded" in result
-        assert "VISIT SCHEDULE" in result
-        assert "screening: 60 min" in result
-        assert "Diabetes Study A" in result
-        assert "+15035551234" in result
-
-    def test_system_prompt_contains_one_at_a_time(self) -> None:
-        """System prompt enforces one question at a time for screening."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={"age": "18+"},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "ONE AT A TIME" in result
-        assert "NEVER ask multiple questions in a single turn" in result
-
-    def test_system_prompt_contains_capture_consent(self) -> None:
-        """System prompt references capture_consent tool."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "capture_consent" in result
-        assert "call capture_consent" in result
-
-    def test_system_prompt_requires_verbal_consent(self) -> None:
-        """System prompt requires waiting for verbal response before consent."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "Do NOT assume consent" in result
-        assert "WAIT" in result
-
-    def test_system_prompt_self_determines_eligibility(self) -> None:
-        """System prompt requires agent to determine eligibility itself."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "YOU decide eligibility" in result
-        assert "Do NOT transfer to determine eligibility" in result
-
-    def test_system_prompt_contains_warm_transfer_tiers(self) -> None:
-        """System prompt defines two-tier warm transfer rules."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "TIER 1" in result
-        assert "MEDICAL EMERGENCY" in result
-        assert "TIER 2" in result
-        assert "PARTICIPANT IS STUCK" in result
-        assert "Would you like me to connect you with a coordinator" in result
-
-    def test_system_prompt_contains_complimentary_uber(self) -> None:
-        """System prompt offers complimentary Uber ride."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "complimentary Uber" in result
+        result = build_system_prompt(**TRIAL_PROMPT_KWARGS)
+        missing = [marker for marker in TRIAL_PROMPT_MARKERS if marker not in result]
+        assert not missing
+
+    @pytest.mark.parametrize("needles", PROMPT_RULES.values(), ids=PROMPT_RULES.keys())
+    def test_states_conversation_rule(self, empty_prompt: str, needles: tuple[str, ...]) -> None:
+        """System prompt spells out each fixed conversation rule."""
+        missing = [needle for needle in needles if needle not in empty_prompt]
+        assert not missing
 
     def test_system_prompt_contains_screening_question_keys(self) -> None:
         """System prompt lists exact question_key values for screening."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={
-                "min_age": 18,
-                "max_age": 75,
-                "diagnosis": "type_2_diabetes",
-                "hba1c_min": 7.0,
-                "hba1c_max": 10.5,
-            },
-            exclusion_criteria={
-                "pregnant_or_nursing": True,
-                "insulin_dependent": True,
-            },
-            visit_templates={},
-        )
-        assert 'question_key="age"' in result
-        assert 'question_key="diagnosis"' in result
-        assert 'question_key="hba1c"' in result
-        assert 'question_key="pregnant_or_nursing"' in result
-        assert 'question_key="insulin_dependent"' in result
-        assert "SCREENING QUESTIONS" in result
-
-    def test_system_prompt_eligibility_result_format(self) -> None:
-        """System prompt references eligible=true/false tool result."""
-        result = build_system_prompt(
-            trial_name="Study",
-            site_name="Site",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "eligible=true" in result
-        assert "eligible=false" in result
-        assert "Do NOT second-guess the tool result" in result
+        result = build_system_prompt(**SCREENING_PROMPT_KWARGS)
+        missing = [marker for marker in SCREENING_PROMPT_MARKERS if marker not in result]
+        assert not missing
 
-    def test_handles_empty_criteria(self) -> None:
+    def test_handles_empty_criteria(self, empty_prompt: str) -> None:
         """System prompt handles empty criteria gracefully."""
-        result = build_system_prompt(
-            trial_name="Study B",
-            site_name="Site B",
-            coordinator_phone="+10000000000",
-            inclusion_criteria={},
-            exclusion_criteria={},
-            visit_templates={},
-        )
-        assert "None specified" in result
-        assert "No visit schedule defined" in result
+        assert "None specified" in empty_prompt
+        assert "No visit schedule defined" in empty_prompt
 
 
 class TestCallResult:
@@ -236,101 +290,71 @@ class TestCallResult:
         assert result.conversation_id == "conv-123"
         assert result.status == "initiated"
 
+    @pytest.mark.parametrize("field_name", ["conversation_id", "status"])
+    def test_result_is_immutable(self, field_name: str) -> None:
+        """Call results are frozen value objects."""
+        result = CallResult(conversation_id="conv-123", status="initiated")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(result, field_name, "x")
+
 
 class TestInitiateOutboundCall:
     """ElevenLabs outbound call initiation."""
 
-    @pytest.fixture
-    def client(self) -> ElevenLabsClient:
-        """Provide an ElevenLabsClient with test config."""
-        return ElevenLabsClient(
-            api_key="test-key",
-            agent_id="test-agent-id",
-            agent_phone_number_id="test-phone-id",
+    async def test_returns_call_result(
+        self, client: ElevenLabsClient, patched_http: FakeHTTPClient
+    ) -> None:
+        """initiate_outbound_call returns a CallResult on success."""
+        patched_http.response = _response(
+            payload={"conversation_id": "conv-abc", "status": "initiated"}
         )
 
-    async def test_returns_call_result(self, client: ElevenLabsClient) -> None:
-        """initiate_outbound_call returns a CallResult on success."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "conversation_id": "conv-abc",
-            "status": "initiated",
-        }
-
-        with patch("src.services.elevenlabs_client.httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.post.return_value = mock_response
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_http
-
-            result = await client.initiate_outbound_call(
-                customer_number="+15035551234",
-                dynamic_variables={"participant_name": "Test"},
-                config_override={"agent": {"prompt": {"prompt": "Hi"}}},
-            )
+        result = await client.initiate_outbound_call(
+            customer_number="+15035551234",
+            dynamic_variables={"participant_name": "Test"},
+            config_override={"agent": {"prompt": {"prompt": "Hi"}}},
+        )
 
         assert isinstance(result, CallResult)
         assert result.conversation_id == "conv-abc"
         assert result.status == "initiated"
+        assert patched_http.requests == [("POST", CONVAI_API_URL)]
 
 
 class TestGetConversation:
     """ElevenLabs get conversation (transcript fetch)."""
 
-    @pytest.fixture
-    def client(self) -> ElevenLabsClient:
-        """Provide an ElevenLabsClient with test config."""
-        return ElevenLabsClient(
-            api_key="test-key",
-            agent_id="test-agent-id",
-            agent_phone_number_id="test-phone-id",
+    async def test_returns_transcript(
+        self, client: ElevenLabsClient, patched_http: FakeHTTPClient
+    ) -> None:
+        """get_conversation returns transcript turns."""
+        patched_http.response = _response(
+            payload={
+                "conversation_id": "conv-abc",
+                "status": "done",
+                "transcript": [
+                    {"role": "agent", "message": "Hello, this is Mary."},
+                    {"role": "user", "message": "Hi Mary."},
+                ],
+            }
         )
 
-    async def test_returns_transcript(self, client: ElevenLabsClient) -> None:
-        """get_conversation returns transcript turns."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "conversation_id": "conv-abc",
-            "status": "done",
-            "transcript": [
-                {"role": "agent", "message": "Hello, this is Mary."},
-                {"role": "user", "message": "Hi Mary."},
-            ],
-        }
-
-        with patch("src.services.elevenlabs_client.httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.get.return_value = mock_response
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_http
-
-            result = await client.get_conversation("conv-abc")
+        result = await client.get_conversation("conv-abc")
 
         assert result["transcript"] is not None
         assert len(result["transcript"]) == 2
         assert result["transcript"][0]["role"] == "agent"
+        assert patched_http.requests == [("GET", f"{CONVAI_CONVERSATION_URL}/conv-abc")]
 
     async def test_returns_empty_on_error(
         self,
         client: ElevenLabsClient,
+        patched_http: FakeHTTPClient,
     ) -> None:
         """get_conversation returns empty transcript on HTTP error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("Not found")
-
-        with patch("src.services.elevenlabs_client.httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.get.return_value = mock_response
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_http
+        patched_http.response = _response(404)
 
-            result = await client.get_conversation("conv-bad")
+        result = await client.get_conversation("conv-bad")
 
         assert result["transcript"] == []
 
@@ -338,49 +362,26 @@ class TestGetConversation:
 class TestGetConversationAudio:
     """ElevenLabs get conversation audio (recording fetch)."""
 
-    @pytest.fixture
-    def client(self) -> ElevenLabsClient:
-        """Provide an ElevenLabsClient with test config."""
-        return ElevenLabsClient(
-            api_key="test-key",
-            agent_id="test-agent-id",
-            agent_phone_number_id="test-phone-id",
-        )
-
-    async def test_returns_audio_bytes(self, client: ElevenLabsClient) -> None:
+    async def test_returns_audio_bytes(
+        self, client: ElevenLabsClient, patched_http: FakeHTTPClient
+    ) -> None:
         """get_conversation_audio returns raw bytes on success."""
         fake_audio = b"\x00\x01\x02\x03audio-data"
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = fake_audio
-
-        with patch("src.services.elevenlabs_client.httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.get.return_value = mock_response
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_http
+        patched_http.response = _response(content=fake_audio)
 
-            result = await client.get_conversation_audio("conv-abc")
+        result = await client.get_conversation_audio("conv-abc")
 
         assert result == fake_audio
+        assert patched_http.requests == [("GET", f"{CONVAI_CONVERSATION_URL}/conv-abc/audio")]
 
     async def test_returns_none_on_error(
         self,
         client: ElevenLabsClient,
+        patched_http: FakeHTTPClient,
     ) -> None:
         """get_conversation_audio returns None on HTTP error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = Exception("Not found")
-
-        with patch("src.services.elevenlabs_client.httpx.AsyncClient") as mock_cls:
-            mock_http = AsyncMock()
-            mock_http.get.return_value = mock_response
-            mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-            mock_http.__aexit__ = AsyncMock(return_value=False)
-            mock_cls.return_value = mock_http
-
-            result = await client.get_conversation_audio("conv-bad")
+        patched_http.response = _response(404)
+
+        result = await client.get_conversation_audio("conv-bad")
 
         assert result is None
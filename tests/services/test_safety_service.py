@@ -1,7 +1,13 @@
 """Tests for the safety service — safety gate → handoff_queue wiring."""
 
+from __future__ import annotations
+
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from src.services.safety_service import (
     build_safety_callback,
@@ -9,198 +15,117 @@ from src.services.safety_service import (
 )
 from src.shared.safety_gate import SafetyResult
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+PARTICIPANT_ID = uuid.UUID(int=1)
+CONVERSATION_ID = uuid.UUID(int=2)
+COORDINATOR_PHONE = "+15551234567"
+HANDOFF_NOW_RESULT = SafetyResult(
+    triggered=True,
+    trigger_type="severe_symptoms",
+    severity="HANDOFF_NOW",
+)
+
+
+@pytest.fixture
+def safety_mocks(mocker: MockerFixture) -> SimpleNamespace:
+    """Patch the callback's lookups, handoff write and warm transfer.
+
+    Returns:
+        SimpleNamespace with ``phone``, ``packet``, ``create`` and
+        ``transfer`` AsyncMocks; the coordinator phone defaults to
+        ``COORDINATOR_PHONE`` and the packet to an empty dict.
+    """
+    target = "src.services.safety_service"
+    return SimpleNamespace(
+        phone=mocker.patch(
+            f"{target}._get_coordinator_phone",
+            new_callable=AsyncMock,
+            return_value=COORDINATOR_PHONE,
+        ),
+        packet=mocker.patch(
+            f"{target}._build_handoff_packet", new_callable=AsyncMock, return_value={}
+        ),
+        create=mocker.patch(
+            f"{target}.create_handoff", new_callable=AsyncMock, return_value=MagicMock()
+        ),
+        transfer=mocker.patch(f"{target}._initiate_warm_transfer", new_callable=AsyncMock),
+    )
+
 
 class TestBuildSafetyCallback:
     """Callback builder creates working handoff writer."""
 
-    async def test_callback_writes_handoff(self) -> None:
+    async def test_callback_writes_handoff(self, safety_mocks: SimpleNamespace) -> None:
         """Callback creates handoff_queue entry on trigger."""
         mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-        trial_id = "trial-1"
-        conversation_id = uuid.uuid4()
-
+        safety_mocks.packet.return_value = {"identity_status": "verified"}
         callback = build_safety_callback(
             mock_session,
-            participant_id,
-            trial_id,
-            conversation_id,
+            PARTICIPANT_ID,
+            "trial-1",
+            CONVERSATION_ID,
         )
 
-        result = SafetyResult(
-            triggered=True,
-            trigger_type="severe_symptoms",
+        await callback(HANDOFF_NOW_RESULT)
+        safety_mocks.create.assert_called_once_with(
+            mock_session,
+            participant_id=PARTICIPANT_ID,
+            reason="severe_symptoms",
             severity="HANDOFF_NOW",
+            conversation_id=CONVERSATION_ID,
+            trial_id="trial-1",
+            summary="Safety gate: severe_symptoms",
+            coordinator_phone=COORDINATOR_PHONE,
         )
 
-        with (
-            patch(
-                "src.services.safety_service._get_coordinator_phone",
-                new_callable=AsyncMock,
-                return_value="+15551234567",
-            ),
-            patch(
-                "src.services.safety_service._build_handoff_packet",
-                new_callable=AsyncMock,
-                return_value={"identity_status": "verified"},
-            ),
-            patch(
-                "src.services.safety_service.create_handoff",
-                new_callable=AsyncMock,
-                return_value=MagicMock(),
-            ) as mock_create,
-            patch(
-                "src.services.safety_service._initiate_warm_transfer",
-                new_callable=AsyncMock,
-            ) as mock_transfer,
-        ):
-            await callback(result)
-            mock_create.assert_called_once_with(
-                mock_session,
-                participant_id=participant_id,
-                reason="severe_symptoms",
-                severity="HANDOFF_NOW",
-                conversation_id=conversation_id,
-                trial_id=trial_id,
-                summary="Safety gate: severe_symptoms",
-                coordinator_phone="+15551234567",
-            )
-
-    async def test_handoff_now_triggers_warm_transfer(self) -> None:
+    async def test_handoff_now_triggers_warm_transfer(self, safety_mocks: SimpleNamespace) -> None:
         """HANDOFF_NOW with call_sid initiates warm transfer."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-        call_sid = "CA123"
-
         callback = build_safety_callback(
-            mock_session,
-            participant_id,
+            AsyncMock(),
+            PARTICIPANT_ID,
             trial_id="trial-1",
-            call_sid=call_sid,
+            call_sid="CA123",
         )
 
-        result = SafetyResult(
-            triggered=True,
-            trigger_type="severe_symptoms",
-            severity="HANDOFF_NOW",
-        )
+        await callback(HANDOFF_NOW_RESULT)
+        safety_mocks.transfer.assert_called_once_with("CA123", COORDINATOR_PHONE)
 
-        with (
-            patch(
-                "src.services.safety_service._get_coordinator_phone",
-                new_callable=AsyncMock,
-                return_value="+15551234567",
-            ),
-            patch(
-                "src.services.safety_service._build_handoff_packet",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
-            patch(
-                "src.services.safety_service.create_handoff",
-                new_callable=AsyncMock,
-                return_value=MagicMock(),
-            ),
-            patch(
-                "src.services.safety_service._initiate_warm_transfer",
-                new_callable=AsyncMock,
-            ) as mock_transfer,
-        ):
-            await callback(result)
-            mock_transfer.assert_called_once_with(
-                call_sid, "+15551234567",
-            )
-
-    async def test_no_transfer_without_call_sid(self) -> None:
+    async def test_no_transfer_without_call_sid(self, safety_mocks: SimpleNamespace) -> None:
         """No warm transfer when call_sid is missing."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-
         callback = build_safety_callback(
-            mock_session,
-            participant_id,
+            AsyncMock(),
+            PARTICIPANT_ID,
             trial_id="trial-1",
         )
 
-        result = SafetyResult(
-            triggered=True,
-            trigger_type="severe_symptoms",
-            severity="HANDOFF_NOW",
-        )
-
-        with (
-            patch(
-                "src.services.safety_service._get_coordinator_phone",
-                new_callable=AsyncMock,
-                return_value="+15551234567",
-            ),
-            patch(
-                "src.services.safety_service._build_handoff_packet",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
-            patch(
-                "src.services.safety_service.create_handoff",
-                new_callable=AsyncMock,
-                return_value=MagicMock(),
-            ),
-            patch(
-                "src.services.safety_service._initiate_warm_transfer",
-                new_callable=AsyncMock,
-            ) as mock_transfer,
-        ):
-            await callback(result)
-            mock_transfer.assert_not_called()
+        await callback(HANDOFF_NOW_RESULT)
+        safety_mocks.transfer.assert_not_called()
 
 
 class TestRunSafetyGate:
     """End-to-end safety gate with handoff wiring."""
 
-    async def test_trigger_creates_handoff(self) -> None:
+    async def test_trigger_creates_handoff(self, safety_mocks: SimpleNamespace) -> None:
         """Triggered safety gate writes to handoff_queue."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-
-        with (
-            patch(
-                "src.services.safety_service._get_coordinator_phone",
-                new_callable=AsyncMock,
-                return_value=None,
-            ),
-            patch(
-                "src.services.safety_service._build_handoff_packet",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
-            patch(
-                "src.services.safety_service.create_handoff",
-                new_callable=AsyncMock,
-                return_value=MagicMock(),
-            ) as mock_create,
-        ):
-            result = await run_safety_gate(
-                "I have severe chest pain",
-                mock_session,
-                participant_id,
-                trial_id="trial-1",
-            )
+        safety_mocks.phone.return_value = None
+        result = await run_safety_gate(
+            "I have severe chest pain",
+            AsyncMock(),
+            PARTICIPANT_ID,
+            trial_id="trial-1",
+        )
         assert result.triggered is True
         assert result.trigger_type == "severe_symptoms"
-        mock_create.assert_called_once()
+        safety_mocks.create.assert_called_once()
 
-    async def test_safe_response_no_handoff(self) -> None:
+    async def test_safe_response_no_handoff(self, safety_mocks: SimpleNamespace) -> None:
         """Safe response does not write to handoff_queue."""
-        mock_session = AsyncMock()
-        participant_id = uuid.uuid4()
-
-        with patch(
-            "src.services.safety_service.create_handoff",
-            new_callable=AsyncMock,
-        ) as mock_create:
-            result = await run_safety_gate(
-                "Your appointment is next Tuesday at 10am.",
-                mock_session,
-                participant_id,
-            )
+        result = await run_safety_gate(
+            "Your appointment is next Tuesday at 10am.",
+            AsyncMock(),
+            PARTICIPANT_ID,
+        )
         assert result.triggered is False
-        mock_create.assert_not_called()
+        safety_mocks.create.assert_not_called()
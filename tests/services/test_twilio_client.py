@@ -1,6 +1,7 @@
 """Tests for the Twilio service client."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -38,10 +39,8 @@ class TestSendSms:
 
     async def test_send_sms_returns_sid(self, twilio_client: TwilioClient) -> None:
         """send_sms returns message SID on success."""
-        mock_message = MagicMock()
-        mock_message.sid = "SM1234567890"
         with patch.object(twilio_client, "_client") as mock_client:
-            mock_client.messages.create.return_value = mock_message
+            mock_client.messages.create.return_value = SimpleNamespace(sid="SM1234567890")
             result = await twilio_client.send_sms(
                 to="+15035551234",
                 body="Hello from Ask Mary",
@@ -54,10 +53,8 @@ class TestInitiateWarmTransfer:
 
     async def test_warm_transfer_returns_call_sid(self, twilio_client: TwilioClient) -> None:
         """initiate_warm_transfer returns call SID."""
-        mock_call = MagicMock()
-        mock_call.sid = "CA1234567890"
         with patch.object(twilio_client, "_client") as mock_client:
-            mock_client.calls.create.return_value = mock_call
+            mock_client.calls.create.return_value = SimpleNamespace(sid="CA1234567890")
             result = await twilio_client.initiate_warm_transfer(
                 participant_call_sid="CA0000000000",
                 coordinator_phone="+15035559999",
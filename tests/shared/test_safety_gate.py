@@ -2,62 +2,53 @@
 
 from unittest.mock import AsyncMock
 
+import pytest
+
 from src.shared.safety_gate import SafetyResult, evaluate_safety
 
+# (response text, context, expected trigger_type, expected severity)
+TRIGGER_CASES = [
+    ("You should take ibuprofen for the pain", None, "medical_advice", "HANDOFF_NOW"),
+    ("I'm having chest pain right now", None, "severe_symptoms", "HANDOFF_NOW"),
+    ("I want to withdraw my consent", None, "consent_withdrawal", "STOP_CONTACT"),
+    ("I'll sue you for this", None, "anger_threats", "HANDOFF_NOW"),
+    (
+        "I had an adverse reaction to the medication",
+        None,
+        "adverse_event",
+        "HANDOFF_NOW",
+    ),
+    (
+        "What do you mean?",
+        {"misunderstanding_count": 3},
+        "repeated_misunderstanding",
+        "CALLBACK_TICKET",
+    ),
+    (
+        "No entiendo nada de lo que dices",
+        {"detected_language": "es", "expected_language": "en"},
+        "language_mismatch",
+        "CALLBACK_TICKET",
+    ),
+]
+
 
 class TestSafetyGateTriggers:
     """Safety gate detects all required trigger types."""
 
-    async def test_medical_advice_triggers(self) -> None:
-        """Medical advice language triggers HANDOFF_NOW."""
-        result = await evaluate_safety("You should take ibuprofen for the pain")
-        assert result.triggered is True
-        assert result.trigger_type == "medical_advice"
-        assert result.severity == "HANDOFF_NOW"
-
-    async def test_severe_symptoms_triggers(self) -> None:
-        """Severe symptom mention triggers HANDOFF_NOW."""
-        result = await evaluate_safety("I'm having chest pain right now")
+    @pytest.mark.parametrize(
+        ("text", "context", "trigger_type", "severity"),
+        TRIGGER_CASES,
+        ids=[case[2] for case in TRIGGER_CASES],
+    )
+    async def test_trigger(
+        self, text: str, context: dict | None, trigger_type: str, severity: str
+    ) -> None:
+        """Each trigger type fires with its expected severity."""
+        result = await evaluate_safety(text, context)
         assert result.triggered is True
-        assert result.trigger_type == "severe_symptoms"
-        assert result.severity == "HANDOFF_NOW"
-
-    async def test_consent_withdrawal_triggers(self) -> None:
-        """Consent withdrawal triggers STOP_CONTACT."""
-        result = await evaluate_safety("I want to withdraw my consent")
-        assert result.triggered is True
-        assert result.trigger_type == "consent_withdrawal"
-        assert result.severity == "STOP_CONTACT"
-
-    async def test_anger_threats_triggers(self) -> None:
-        """Anger/threats trigger HANDOFF_NOW."""
-        result = await evaluate_safety("I'll sue you for this")
-        assert result.triggered is True
-        assert result.trigger_type == "anger_threats"
-        assert result.severity == "HANDOFF_NOW"
-
-    async def test_adverse_event_triggers(self) -> None:
-        """Adverse event report triggers HANDOFF_NOW."""
-        result = await evaluate_safety("I had an adverse reaction to the medication")
-        assert result.triggered is True
-        assert result.trigger_type == "adverse_event"
-        assert result.severity == "HANDOFF_NOW"
-
-    async def test_repeated_misunderstanding_triggers(self) -> None:
-        """Repeated misunderstanding triggers CALLBACK_TICKET."""
-        context = {"misunderstanding_count": 3}
-        result = await evaluate_safety("What do you mean?", context)
-        assert result.triggered is True
-        assert result.trigger_type == "repeated_misunderstanding"
-        assert result.severity == "CALLBACK_TICKET"
-
-    async def test_language_mismatch_triggers(self) -> None:
-        """Language mismatch triggers CALLBACK_TICKET."""
-        context = {"detected_language": "es", "expected_language": "en"}
-        result = await evaluate_safety("No entiendo nada de lo que dices", context)
-        assert result.triggered is True
-        assert result.trigger_type == "language_mismatch"
-        assert result.severity == "CALLBACK_TICKET"
+        assert result.trigger_type == trigger_type
+        assert result.severity == severity
 
     async def test_misunderstanding_below_threshold_no_trigger(self) -> None:
         """Misunderstanding count below 3 does not trigger."""
@@ -82,6 +73,11 @@ class TestSafetyGateTriggers:
         result = await evaluate_safety("I'm having CHEST PAIN")
         assert result.triggered is True
 
+    async def test_priority_order_beats_text_position(self) -> None:
+        """Higher-priority trigger wins even when it appears later in the text."""
+        result = await evaluate_safety("I had a side effect, so you should take less")
+        assert result.trigger_type == "medical_advice"
+
 
 class TestSafetyGateLatency:
     """Safety gate timing is instrumented."""
@@ -6,6 +6,7 @@ from src.shared.validators import (
     validate_dob_year,
     validate_phone,
     validate_zip_code,
+    with_dnc_flag,
 )
 
 
@@ -92,6 +93,22 @@ class TestIsDncBlocked:
         assert is_dnc_blocked(None, "voice") is False
 
 
+class TestWithDncFlag:
+    """DNC flag updates build a new dict."""
+
+    def test_adds_flag_without_mutating_input(self) -> None:
+        """Existing flags are kept and the input dict is left unchanged."""
+        flags = {"sms": True}
+        updated = with_dnc_flag(flags, "voice")
+        assert updated == {"sms": True, "voice": True}
+        assert updated is not flags
+        assert flags == {"sms": True}
+
+    def test_none_flags(self) -> None:
+        """None flags start a fresh dict."""
+        assert with_dnc_flag(None, "all_channels") == {"all_channels": True}
+
+
 class TestValidateChannel:
     """Channel validation."""
 
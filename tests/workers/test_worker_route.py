@@ -23,7 +23,6 @@ def mock_session():
     return session
 
 
-@pytest.mark.asyncio
 async def test_worker_route_calls_handler(
     app, mock_session,
 ) -> None:
@@ -54,7 +53,6 @@ async def test_worker_route_calls_handler(
     app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_worker_route_returns_handler_error(
     app, mock_session,
 ) -> None:
@@ -86,7 +84,6 @@ async def test_worker_route_returns_handler_error(
     app.dependency_overrides.clear()
 
 
-@pytest.mark.asyncio
 async def test_worker_route_returns_duplicate(
     app, mock_session,
 ) -> None: